@@ -9,20 +9,31 @@
 # Feel free to modify and share under GPL v3
 
 import tkinter as tk
-from tkinter import ttk, filedialog, scrolledtext, messagebox
+from tkinter import ttk, messagebox
 import os
 import sys
 import time
-import subprocess
-import webbrowser
 import re
-import traceback  # For better error reporting
+import threading
+import queue
+import json
+import tempfile
+import stat
+from pathlib import Path
+
+# Optional: event-driven file watching instead of polling the disk
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 # --- VENV AUTO-BOOTSTRAP (SPLASH-FIRST, BACKGROUND) ---
 def ensure_venv_ready(callback):
     import threading
     import sys, os, subprocess
-    venv_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "venv_spotify")
+    venv_dir = _VENV_DIR
     venv_python = os.path.join(venv_dir, "bin", "python")
     if sys.platform == "win32":
         venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
@@ -39,14 +50,26 @@ def ensure_venv_ready(callback):
                 "requests",
                 "charset_normalizer",
                 "idna",
-                "urllib3"
+                "urllib3",
+                "watchdog"
             ]
-            subprocess.run([venv_python, "-m", "pip", "install", "--upgrade", "pip"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            subprocess.run([venv_python, "-m", "pip", "install"] + reqs, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # Output goes to DEVNULL, so don't let pip render progress bars or version hints for nobody
+            pip_install = [venv_python, "-m", "pip", "install", "--disable-pip-version-check",
+                           "--no-input", "--progress-bar=off"]
+            subprocess.run(pip_install + ["--upgrade", "pip"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.run(pip_install + reqs, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             os.execv(venv_python, [venv_python] + sys.argv)
         callback()
     threading.Thread(target=setup, daemon=True).start()
 
+# Debug output only in dev mode (same switch as the modern GUI)
+DEBUG = os.environ.get('SPOTIFY_DEV_MODE') == '1'
+
+# Project paths, resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_VENV_DIR = os.path.join(_MODULE_DIR, "venv_spotify")
+_ENV_PATH = os.path.join(_MODULE_DIR, ".env")
+
 # --- Detect session type (Wayland/X11) ---
 SESSION_TYPE = os.environ.get("XDG_SESSION_TYPE", "unknown").lower()
 
@@ -59,7 +82,8 @@ def get_mouse_monitor_geometry(width, height):
         get_monitors = None
         xdisplay = None
     if SESSION_TYPE == "wayland" or not get_monitors or not xdisplay:
-        print("[DEBUG] Wayland detected or required modules not available: precise window placement is not possible.")
+        if DEBUG:
+            print("[DEBUG] Wayland detected or required modules not available: precise window placement is not possible.")
         # Fallback: center on primary screen
         try:
             import tkinter as tk
@@ -88,7 +112,8 @@ def get_mouse_monitor_geometry(width, height):
         y = m.y + (m.height - height) // 2
         return x, y, True
     except Exception as e:
-        print(f"[DEBUG] get_mouse_monitor_geometry fallback: {e}")
+        if DEBUG:
+            print(f"[DEBUG] get_mouse_monitor_geometry fallback: {e}")
         try:
             import tkinter as tk
             root = tk.Tk()
@@ -102,12 +127,276 @@ def get_mouse_monitor_geometry(width, height):
         y = (screen_height - height) // 2
         return x, y, False
 
+def center_window(window, size=None):
+    """
+    Center a window on the monitor under the mouse, returns True if placement was precise.
+    Pass size=(width, height) when it is already known to skip the synchronous layout pass.
+    """
+    if size:
+        width, height = size
+    else:
+        window.update_idletasks()
+        # A single "WxH+X+Y" query instead of separate winfo_width/winfo_height round-trips
+        size = re.match(r"(\d+)x(\d+)", window.geometry())
+        width, height = (int(size.group(1)), int(size.group(2))) if size else (1, 1)
+        if width <= 1 or height <= 1:
+            # Not realized yet - fall back to the size the window asks for
+            width, height = window.winfo_reqwidth(), window.winfo_reqheight()
+    x, y, precise = get_mouse_monitor_geometry(width, height)
+    window.geometry(f"+{x}+{y}")
+    return precise
+
+def set_clipboard(widget, text):
+    """Replace the clipboard contents - talks to Tcl directly, skipping the Misc kwargs wrappers"""
+    call = widget.tk.call
+    call("clipboard", "clear")
+    call("clipboard", "append", "--", text)
+
+# --- File watching ---
+class _FileChangeHandler(FileSystemEventHandler):
+    """Calls back when one specific file is modified, created or moved into place"""
+    def __init__(self, path, callback):
+        super().__init__()
+        self.path = os.path.abspath(path)
+        self.callback = callback
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ("modified", "created", "moved"):
+            return
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if self.path in (os.path.abspath(p) for p in paths if p):
+            self.callback()
+
+def watch_file(widget, path, callback):
+    """
+    Watch a file with the OS file notification API (inotify, FSEvents,
+    ReadDirectoryChangesW) and run callback on the Tk thread when it changes.
+    Returns the running observer, or None if watchdog is not installed.
+    """
+    if Observer is None:
+        return None
+    # Tk is not thread-safe - always hand the event over to the main loop
+    handler = _FileChangeHandler(path, lambda: widget.after_idle(callback))
+    observer = Observer()
+    observer.schedule(handler, os.path.dirname(os.path.abspath(path)) or ".", recursive=False)
+    observer.daemon = True
+    try:
+        observer.start()
+    except Exception:
+        return None
+    return observer
+
+def stop_watching(observer):
+    """Stop a watcher created by watch_file (None is ignored)"""
+    if observer is not None:
+        observer.stop()
+
+# --- .env parsing ---
+ENV_KEYS = frozenset(("SPOTIPY_CLIENT_ID", "SPOTIPY_CLIENT_SECRET", "SPOTIPY_REDIRECT_URI"))
+
+_ENV_KEYS_BYTES = {key.encode(): key for key in ENV_KEYS}
+
+# Values of an unedited credentials template - treated like missing values
+ENV_PLACEHOLDERS = frozenset(("your_client_id_here", "your_client_secret_here"))
+
+# Lookup table over all byte values: 1 if the byte may appear in a .env key
+_ENV_KEY_CHARS = bytes(1 if c < 128 and (chr(c).isalnum() or chr(c) in '._-') else 0 for c in range(256))
+
+# Parsed .env files: path -> (mtime_ns, size, values)
+_ENV_CACHE = {}
+
+def stat_or_none(path):
+    """os.stat() that returns None for a missing file - one syscall for exists + mtime"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def parse_env_bytes(data):
+    """
+    Single scan over raw .env bytes, only the Spotify keys are decoded.
+    Understands an "export " prefix, spaces around "=" and quoted values like python-dotenv.
+    The last occurrence of a key wins.
+    """
+    values = {}
+    pos = 0
+    end = len(data)
+    while pos < end:
+        eol = data.find(b'\n', pos)
+        if eol == -1:
+            eol = end
+        k = pos
+        while k < eol and data[k] in b' \t':
+            k += 1
+        if data.startswith(b'export ', k, eol):
+            k += 7
+            while k < eol and data[k] in b' \t':
+                k += 1
+        key_start = k
+        while k < eol and _ENV_KEY_CHARS[data[k]]:
+            k += 1
+        key_end = k
+        while k < eol and data[k] in b' \t':
+            k += 1
+        if k < eol and data[k] == 0x3D:  # '='
+            key = _ENV_KEYS_BYTES.get(data[key_start:key_end])
+            if key:
+                value = data[k + 1:eol].strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in b'"\'':
+                    value = value[1:-1]
+                values[key] = value.decode('utf-8', 'replace')
+        pos = eol + 1
+    return values
+
+def load_env_cached(path, st=None):
+    """
+    Read the Spotify keys from a .env file into a dict.
+    The result is reused as long as the file's mtime and size are unchanged.
+    Pass st if the caller already has a fresh os.stat() result for path.
+    Raises OSError if the file can't be read.
+    """
+    if st is None:
+        st = os.stat(path)
+    cached = _ENV_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    # One read, one scan over the bytes
+    values = parse_env_bytes(Path(path).read_bytes())
+    _ENV_CACHE[path] = (st.st_mtime_ns, st.st_size, values)
+    return values
+
+def invalidate_env_cache(path):
+    """Forget the cached parse of a .env file after writing it"""
+    _ENV_CACHE.pop(path, None)
+
+def write_file_atomic(path, content):
+    """Write content with a single write() to a temp file and move it into place"""
+    # A unique temp name, so two running instances never write into the same temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+    try:
+        try:
+            os.write(fd, content.encode('utf-8'))
+        finally:
+            os.close(fd)
+        # mkstemp creates the file 0600 - an existing file keeps its own permissions,
+        # a new one (e.g. a fresh .env with secrets) stays private
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        # os.replace is atomic on POSIX and Windows - readers never see a half-written file
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# --- Subprocess output ---
+_SPOTIFY_PLAYLIST_URL_RE = re.compile(r'https://open\.spotify\.com/playlist/\w+')
+
+def strip_ansi(s):
+    """Remove ANSI color codes like ESC[0;33m and ESC[0m from s, without a regex"""
+    i = s.find('\x1b[')
+    if i == -1:
+        return s  # Common case: nothing to strip, no copy
+    parts = []
+    start = 0
+    while i != -1:
+        end = s.find('m', i + 2)
+        if end == -1:
+            break
+        if s[i + 2:end].strip('0123456789;'):
+            # Not a color code, keep it and look for the next escape
+            i = s.find('\x1b[', i + 2)
+            continue
+        parts.append(s[start:i])
+        start = end + 1
+        i = s.find('\x1b[', start)
+    parts.append(s[start:])
+    return ''.join(parts)
+
+def format_output_line(line):
+    """Format one line of generator output for the console, returns (text, playlist URL or None)"""
+    # Strip ANSI color codes from terminal output
+    clean_line = strip_ansi(line.strip())
+    
+    # Format the output to make it more readable
+    if "Prüfe Python-Umgebung" in clean_line:
+        return f"\n━━━ Environment Check ━━━\n{clean_line}\n", None
+    if "Starte Playlist-Erstellung" in clean_line:
+        return f"\n━━━ Creating Playlist ━━━\n{clean_line}\n", None
+    # One scan for the marker main.py prints, its URL follows directly
+    head, marker, link = clean_line.partition("Playlist-Link:")
+    if marker or "Playlist erstellt:" in head:
+        playlist_url = None
+        url_match = (_SPOTIFY_PLAYLIST_URL_RE.match(link.lstrip()) if marker
+                     else _SPOTIFY_PLAYLIST_URL_RE.search(clean_line))
+        if url_match:
+            playlist_url = url_match.group(0)
+            if DEBUG:
+                print(f"Found playlist URL: {playlist_url}")
+        return f"\n━━━ Playlist Created ━━━\n✅ {clean_line}\n", playlist_url
+    if "Gefunden via" in clean_line:
+        return f"✓ {clean_line}\n", None
+    if "Batch hinzugefügt:" in clean_line or "Erfolgreich" in clean_line:
+        return f"\n━━━ Summary ━━━\n✅ {clean_line}\n", None
+    if "Fehler:" in clean_line or "Error:" in clean_line:
+        return f"❌ {clean_line}\n", None
+    return f"{clean_line}\n", None
+
+# Keys that keep working in the read-only console: Ctrl+C/Ctrl+A and navigation
+_CONSOLE_CTRL_KEYS = frozenset("cCaA")
+_CONSOLE_NAV_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+
+def console_key_guard(event, _ctrl=_CONSOLE_CTRL_KEYS, _nav=_CONSOLE_NAV_KEYS):
+    """<Key> handler for the console: only copy, select-all and navigation get through"""
+    if (event.state & 0x4 and event.keysym in _ctrl) or event.keysym in _nav:
+        return None
+    return "break"
+
+# --- Recent files ---
+# Remembered between launches so startup doesn't have to rescan the project directory
+RECENT_FILES_PATH = os.path.join(os.path.expanduser("~"), ".config", "spotify_playlist_generator", "recent.json")
+
+def read_recent_files(path=RECENT_FILES_PATH):
+    """Return the remembered recent files that still exist, or [] if there is no usable cache"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            files = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(files, list):
+        return []
+    return [p for p in files if isinstance(p, str) and os.path.exists(p)]
+
+def write_recent_files(files, path=RECENT_FILES_PATH):
+    """Persist the recent files list (atomically, like the .env)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_file_atomic(path, json.dumps(files))
+
+def scan_txt_files(directory):
+    """The .txt files in directory, most recently modified first - one scandir pass"""
+    found = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # DirEntry already knows the file type, only .txt files get a stat
+            if entry.name.endswith(".txt") and entry.is_file():
+                found.append((entry.stat().st_mtime, entry.path))
+    return [path for _mtime, path in sorted(found, reverse=True)]
+
 # UI layout constants - carefully tuned for best user experience
 INITIAL_WINDOW_WIDTH = 600
 INITIAL_WINDOW_HEIGHT = 450
 EXPANDED_WINDOW_HEIGHT = 600
 CONSOLE_MIN_HEIGHT = 100
 CONSOLE_EXPANDED_HEIGHT = 300
+CONSOLE_MAX_LINES = 5000  # Oldest console lines are dropped beyond this
+CONSOLE_FLUSH_MS = 33     # Console output is inserted in batches at most this often (~30 Hz)
+CONSOLE_IDLE_MS = 200     # Console turns read-only again after this long without output
+SPLASH_FRAME_MS = 50      # Splash progress bar frame interval
+INSTALL_STATUS_MS = 100   # Installer status line refresh interval (~10 Hz)
 
 class SpotifyCredentialsDialog(tk.Toplevel):
     def __init__(self, parent, env_path):
@@ -119,8 +408,12 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         # Initialize variables that are referenced elsewhere
         self.show_secret_var = tk.BooleanVar(value=False)
         
-        # Track file modification time
-        self.last_modified_time = os.path.getmtime(self.env_path) if os.path.exists(self.env_path) else 0
+        # Track file modification time - this stat is reused below, later stats keep _env_exists current
+        st = stat_or_none(self.env_path)
+        self.last_modified_time = st.st_mtime_ns if st else 0
+        self._env_exists = st is not None
+        # mtime of the .env contents currently shown in the form
+        self._last_loaded_mtime = None
         
         # Configure window
         self.title("Spotify Credentials Setup")
@@ -131,27 +424,41 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         # Use system default theme (light theme)
         # No explicit background color to maintain system look
         
-        self.grab_set()  # Modal dialog
         self.transient(parent)  # Associate with parent window
-        # Center on monitor under mouse
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x, y, _ = get_mouse_monitor_geometry(width, height)
-        self.geometry(f"+{x}+{y}")
+        # Stay hidden until positioned, see _center_and_show
+        self.withdraw()
         
         # Create the UI
         self.create_widgets()
+        # Center on monitor under mouse once Tk is idle - no layout pass during construction
+        self.after_idle(self._center_and_show)
+        
+        # .env key -> variable it fills, built once for the parser
+        self._key_vars = {
+            "SPOTIPY_CLIENT_ID": self.client_id_var,
+            "SPOTIPY_CLIENT_SECRET": self.client_secret_var,
+            "SPOTIPY_REDIRECT_URI": self.redirect_uri_var,
+        }
         
         # Load existing values if any
-        self.load_existing_credentials()
+        if st is not None:
+            self.load_existing_credentials(st=st)
         
+        # Reload when the .env file changes - fall back to polling every 500ms without watchdog
+        self.env_observer = watch_file(self, self.env_path, self.on_env_file_changed)
+        if self.env_observer is None:
+            self.after(500, self.check_for_file_changes)
+        
+    def _center_and_show(self):
+        """Place the dialog on the monitor under the mouse, then show it as a modal window"""
+        if not self.winfo_exists():
+            return
+        center_window(self, size=(650, 450))
+        self.deiconify()
+        self.grab_set()  # Modal dialog
         # Set focus on first entry
         self.client_id_entry.focus_set()
-        
-        # Set up file monitoring - check every 500ms for changes
-        self.after(500, self.check_for_file_changes)
-        
+    
     def create_widgets(self):
         # Main frame with padding
         main_frame = ttk.Frame(self)
@@ -202,7 +509,7 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         self.client_id_entry = ttk.Entry(form_frame, textvariable=self.client_id_var, width=50, state="readonly")
         self.client_id_entry.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         copy_id_btn = ttk.Button(form_frame, text="Copy", width=5,
-                              command=lambda: self.copy_to_clipboard(self.client_id_var.get()))
+                              command=lambda: self.copy_to_clipboard(self.client_id_var.get(), copy_id_btn))
         copy_id_btn.grid(row=0, column=2, padx=5, pady=5)
 
         # Client Secret - read-only but selectable, now visible by default without show button
@@ -216,7 +523,7 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         
         # Copy button directly in column 2 without the show checkbox frame
         copy_secret_btn = ttk.Button(form_frame, text="Copy", width=5,
-                                  command=lambda: self.copy_to_clipboard(self.client_secret_var.get()))
+                                  command=lambda: self.copy_to_clipboard(self.client_secret_var.get(), copy_secret_btn))
         copy_secret_btn.grid(row=1, column=2, padx=5, pady=5)
         
         # Redirect URI - read-only but selectable
@@ -228,7 +535,7 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         redirect_uri_entry.grid(row=2, column=1, sticky="w", padx=5, pady=5)
         
         copy_uri_btn = ttk.Button(form_frame, text="Copy", width=5,
-                               command=self.copy_redirect_uri)
+                               command=lambda: self.copy_redirect_uri(copy_uri_btn))
         copy_uri_btn.grid(row=2, column=2, padx=5, pady=5)
         
         # Note about redirect URI
@@ -248,32 +555,43 @@ class SpotifyCredentialsDialog(tk.Toplevel):
                                command=self.open_env_in_editor)
         save_button.pack(side=tk.RIGHT, padx=5)
 
-    def copy_to_clipboard(self, text):
+    def copy_to_clipboard(self, text, widget=None):
         """Copy the provided text to clipboard and show a brief tooltip"""
-        self.clipboard_clear()
-        self.clipboard_append(text)
-        messagebox.showinfo("Copied", "Value copied to clipboard!")
+        set_clipboard(self, text)
+        self._show_toast(widget or self, "Value copied to clipboard!")
+    
+    def _show_toast(self, widget, text, duration=1500):
+        """Show a short message below a widget that disappears by itself - doesn't block like a messagebox"""
+        toast = tk.Toplevel(self)
+        toast.overrideredirect(True)
+        label = tk.Label(toast, text=text, bg="#333333", fg="white", padx=8, pady=4, justify="left")
+        label.pack()
+        x = widget.winfo_rootx()
+        y = widget.winfo_rooty() + widget.winfo_height() + 4
+        toast.geometry(f"+{x}+{y}")
+        toast.after(duration, toast.destroy)
         
     def open_env_in_editor(self):
         """Open the .env file in system's default text editor"""
+        import subprocess
         try:
-            if os.path.exists(self.env_path):
-                if sys.platform == 'win32':
-                    os.startfile(self.env_path)
-                elif sys.platform == 'darwin':
-                    subprocess.run(['open', self.env_path])                    
-                else:
-                    subprocess.run(['xdg-open', self.env_path])
-                    
-                messagebox.showinfo("Text Editor", "Opening .env file in your text editor.\nAfter editing, save the file and click 'Save Credentials' to apply changes.")
+            # Create a template first if there is no .env yet
+            if not self._env_exists:
+                write_file_atomic(self.env_path,
+                                  "# Spotify API Credentials\n"
+                                  "SPOTIPY_CLIENT_ID=\n"
+                                  "SPOTIPY_CLIENT_SECRET=\n"
+                                  "SPOTIPY_REDIRECT_URI=http://127.0.0.1:8888/callback\n")
+                self._env_exists = True
+            
+            if sys.platform == 'win32':
+                os.startfile(self.env_path)
+            elif sys.platform == 'darwin':
+                subprocess.run(['open', self.env_path])                    
             else:
-                with open(self.env_path, "w") as f:
-                    f.write("# Spotify API Credentials\n")
-                    f.write("SPOTIPY_CLIENT_ID=\n")
-                    f.write("SPOTIPY_CLIENT_SECRET=\n")
-                    f.write("SPOTIPY_REDIRECT_URI=http://127.0.0.1:8888/callback\n")
-                    
-                self.open_env_in_editor()  # Retry opening after creating
+                subprocess.run(['xdg-open', self.env_path])
+                
+            messagebox.showinfo("Text Editor", "Opening .env file in your text editor.\nAfter editing, save the file and click 'Save Credentials' to apply changes.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open .env file: {str(e)}")
         
@@ -286,31 +604,36 @@ class SpotifyCredentialsDialog(tk.Toplevel):
     
     def open_spotify_dev(self):
         """Open the Spotify Developer Portal in a browser"""
+        import webbrowser
         webbrowser.open("https://developer.spotify.com/dashboard")
     
-    def copy_redirect_uri(self):
+    def copy_redirect_uri(self, widget=None):
         """Copy the redirect URI to clipboard"""
-        self.clipboard_clear()
-        self.clipboard_append(self.redirect_uri_var.get())
-        messagebox.showinfo("Copied", "Redirect URI copied to clipboard.\n\nRemember to add this exact URI to your Spotify App settings.")
+        set_clipboard(self, self.redirect_uri_var.get())
+        self._show_toast(widget or self, "Redirect URI copied to clipboard.\nRemember to add this exact URI to your Spotify App settings.", 3000)
     
-    def load_existing_credentials(self):
+    def load_existing_credentials(self, force=False, st=None):
         """Load existing credentials from .env file if it exists"""
+        if st is None:
+            st = stat_or_none(self.env_path)
+            self._env_exists = st is not None
+            if st is None:
+                return
+        # Nothing to do if the form already shows this version of the file
+        if not force and st.st_mtime_ns == self._last_loaded_mtime:
+            return
         try:
-            if os.path.exists(self.env_path):
-                with open(self.env_path, "r") as f:
-                    for line in f:
-                        if line.startswith("SPOTIPY_CLIENT_ID="):
-                            _, value = line.strip().split("=", 1)
-                            self.client_id_var.set(value)
-                        elif line.startswith("SPOTIPY_CLIENT_SECRET="):
-                            _, value = line.strip().split("=", 1)
-                            self.client_secret_var.set(value)
-                        elif line.startswith("SPOTIPY_REDIRECT_URI="):
-                            _, value = line.strip().split("=", 1)
-                            self.redirect_uri_var.set(value)
+            values = load_env_cached(self.env_path, st)
+        except FileNotFoundError:
+            self._env_exists = False
+            return
         except Exception as e:
             print(f"Error loading credentials: {e}")
+            return
+        # Dict dispatch: .env key -> StringVar, placeholders show as empty fields
+        for key, value in values.items():
+            self._key_vars[key].set("" if value in ENV_PLACEHOLDERS else value)
+        self._last_loaded_mtime = st.st_mtime_ns
     
     def save_credentials(self):
         """Save credentials to .env file"""
@@ -326,11 +649,14 @@ class SpotifyCredentialsDialog(tk.Toplevel):
             redirect_uri = "http://127.0.0.1:8888/callback"
             
         try:
-            with open(self.env_path, "w") as f:
-                f.write("# Spotify API Credentials - Fill these values!\n")
-                f.write(f"SPOTIPY_CLIENT_ID={client_id}\n")
-                f.write(f"SPOTIPY_CLIENT_SECRET={client_secret}\n")
-                f.write(f"SPOTIPY_REDIRECT_URI={redirect_uri}\n")
+            write_file_atomic(self.env_path,
+                              "# Spotify API Credentials - Fill these values!\n"
+                              f"SPOTIPY_CLIENT_ID={client_id}\n"
+                              f"SPOTIPY_CLIENT_SECRET={client_secret}\n"
+                              f"SPOTIPY_REDIRECT_URI={redirect_uri}\n")
+            invalidate_env_cache(self.env_path)
+            self._last_loaded_mtime = None
+            self._env_exists = True
                 
             messagebox.showinfo("Success", "Credentials saved successfully!")
             self.result = True
@@ -350,16 +676,26 @@ class SpotifyCredentialsDialog(tk.Toplevel):
         # Keeping it as a stub for compatibility
         pass
 
+    def on_env_file_changed(self):
+        """Reload credentials after the watcher reported a change to the .env file"""
+        if self.winfo_exists():
+            self.load_existing_credentials()
+
+    def destroy(self):
+        """Stop watching the .env file before closing the dialog"""
+        stop_watching(getattr(self, 'env_observer', None))
+        self.env_observer = None
+        super().destroy()
+
     def check_for_file_changes(self):
         """Check if the .env file has been modified externally and reload if so"""
         try:
-            if os.path.exists(self.env_path):
-                current_modified_time = os.path.getmtime(self.env_path)
-                
-                if current_modified_time != self.last_modified_time:
-                    # File has been modified, reload credentials
-                    self.last_modified_time = current_modified_time
-                    self.load_existing_credentials()
+            st = stat_or_none(self.env_path)
+            self._env_exists = st is not None
+            if st and st.st_mtime_ns != self.last_modified_time:
+                # File has been modified, reload credentials
+                self.last_modified_time = st.st_mtime_ns
+                self.load_existing_credentials(st=st)
         except Exception as e:
             pass  # Ignore errors in file monitoring
             
@@ -374,48 +710,59 @@ class SpotifyPlaylistGeneratorGUI:
         self.root.geometry(f"{INITIAL_WINDOW_WIDTH}x{INITIAL_WINDOW_HEIGHT}")
         self.root.minsize(INITIAL_WINDOW_WIDTH, INITIAL_WINDOW_HEIGHT)
         # Center on monitor under mouse
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x, y, _ = get_mouse_monitor_geometry(width, height)
-        self.root.geometry(f"+{x}+{y}")
+        center_window(self.root)
         
         # Use light theme colors
         self.accent_color = "#1DB954"  # Spotify green
         self.bg_color = "#F8F8F8"      # Light background color for dialogs
         
-        # Configure style
+        # Configure style - the default theme (which is light on most systems) plus the named
+        # button styles create_widgets refers to, configured once here
         self.style = ttk.Style()
-        try:
-            # Use the default theme (which is light on most systems)
-            pass
-        except:
-            pass
+        self.style.configure("Accent.TButton", foreground="white", background=self.accent_color,
+                             font=("Helvetica", 11, "bold"), padding=(15, 5))
+        self.style.map("Accent.TButton", background=[("disabled", "#A8A8A8"), ("active", "#1ED760")])
+        self.style.configure("Recent.TButton", font=("Helvetica", 9), padding=(4, 1))
         
         # Track window state
         self.expanded = False
         
         # Path variables
-        self.current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.venv_dir = os.path.join(self.current_dir, "venv_spotify")
-        self.env_path = os.path.join(self.current_dir, ".env")
+        self.current_dir = _MODULE_DIR
+        self.venv_dir = _VENV_DIR
+        self.env_path = _ENV_PATH
+        self.install_script_path = os.path.join(_MODULE_DIR, "install.py")
+        self.shell_script_path = os.path.join(_MODULE_DIR, "generate.sh")
+        self.main_script_path = os.path.join(_MODULE_DIR, "main.py")
         
         # UI variables
         self.playlist_name = tk.StringVar(value="")
         self.songs_file_path = tk.StringVar(value="")
         self.status_var = tk.StringVar(value="Ready")
         
-        # Recent files history (could be loaded from config)
+        # Recent files history (persisted in RECENT_FILES_PATH by load_recent_files/browse_file)
         self.recent_files = []
         
+        # Console output buffer, flushed in batches by _flush_log
+        self._pending_log = []
+        self._flush_job = None
+        self._last_flush = 0.0
+        # Console stays NORMAL while output is arriving, _console_idle disables it again
+        self._console_busy = False
+        
+        # Environment check results: env_path -> (mtime_ns, valid), venv existence (None = unknown)
+        self._env_cache = {}
+        self._venv_exists = None
+        self._python_path = None
+        
         # Create widgets
         self.create_widgets()
         
-        # Check environment on startup
-        self.root.after(500, self.check_environment)
-        
-        # Set up resize handling
+        # Set up resize handling - debounced, see on_resize
+        self._resize_after_id = None
+        self._last_size = None
         self.root.bind("<Configure>", self.on_resize)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Create right-click menu for console
         self.console_menu = tk.Menu(self.root, tearoff=0)
@@ -428,16 +775,27 @@ class SpotifyPlaylistGeneratorGUI:
         
         # Bind right-click to console
         self.console.bind("<Button-3>", self.show_context_menu)
+        # The console is briefly writable while output arrives - never let typing change it
+        self.console.bind("<Key>", console_key_guard)
     
         self.root.after(100, self.center_on_monitor)
         self.root.after(400, self.center_on_monitor)  # Nochmals nach kurzem Delay
         self.placement_warning = None
 
+    def on_close(self):
+        """Stop the console flush timer and file watching, then close the window"""
+        if self._flush_job:
+            self.root.after_cancel(self._flush_job)
+            self._flush_job = None
+        if getattr(self, 'monitoring_job', None):
+            self.root.after_cancel(self.monitoring_job)
+            self.monitoring_job = None
+        stop_watching(getattr(self, 'file_observer', None))
+        self.file_observer = None
+        self.root.destroy()
+
     def center_on_monitor(self):
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x, y, precise = get_mouse_monitor_geometry(width, height)
-        self.root.geometry(f"+{x}+{y}")
+        precise = center_window(self.root)
         if not precise:
             if not self.placement_warning:
                 self.placement_warning = tk.Label(self.root, text="Hinweis: Exakte Fensterplatzierung ist auf diesem System nicht möglich (z.B. Wayland oder restriktiver Window-Manager)", fg="red")
@@ -449,7 +807,7 @@ class SpotifyPlaylistGeneratorGUI:
     
     def run_installation(self):
         """Run the installation script to set up the environment"""
-        install_script = os.path.join(self.current_dir, "install.py")
+        install_script = self.install_script_path
         if not os.path.exists(install_script):
             messagebox.showerror("Error", "Installation script not found!")
             return False
@@ -462,11 +820,7 @@ class SpotifyPlaylistGeneratorGUI:
         progress_win.configure(bg=self.bg_color)
         progress_win.grab_set()  # Modal dialog
         # Center on monitor under mouse
-        progress_win.update_idletasks()
-        width = progress_win.winfo_width()
-        height = progress_win.winfo_height()
-        x, y = get_mouse_monitor_geometry(width, height)
-        progress_win.geometry(f"+{x}+{y}")
+        center_window(progress_win)
         
         # Progress info
         frame = ttk.Frame(progress_win)
@@ -476,66 +830,87 @@ class SpotifyPlaylistGeneratorGUI:
                        font=("Helvetica", 12))
         label.pack(pady=(0, 20))
         
+        # Not start()ed - drain_output steps the bar only when installer output arrives
         progress = ttk.Progressbar(frame, mode="indeterminate", length=300)
         progress.pack(pady=10)
-        progress.start()
         
         status_var = tk.StringVar(value="Installing dependencies...")
         status_label = ttk.Label(frame, textvariable=status_var)
         status_label.pack(pady=10)
         
-        progress_win.update()
-        
+        # No update() here - the window is painted by wait_window()'s event loop below
+        import subprocess
         try:
             # Run installation
             process = subprocess.Popen(
                 [sys.executable, install_script],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=65536
             )
+        except Exception as e:
+            messagebox.showerror("Installation Error", str(e))
+            progress_win.destroy()
+            return False
+        
+        # Read the output on a worker thread so the Tk loop is never blocked by a pipe read
+        output_queue = queue.Queue()
+        result = {"success": False}
+        
+        def pump_output():
+            # Binary 64 KiB reads, only complete lines are decoded - no per-byte text layer
+            fd = process.stdout.fileno()
+            pending = bytearray()
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                pending += chunk
+                cut = pending.rfind(b"\n")
+                if cut == -1:
+                    continue
+                output_queue.put(pending[:cut].decode("utf-8", "replace").rsplit("\n", 1)[-1])
+                del pending[:cut + 1]
+            if pending:
+                output_queue.put(pending.decode("utf-8", "replace"))
+            process.stdout.close()
+        
+        reader = threading.Thread(target=pump_output, daemon=True)
+        reader.start()
+        
+        def drain_output():
+            if not progress_win.winfo_exists():
+                return
+            # Take everything queued since the last tick - only the newest line is readable anyway
+            last_line = None
+            while True:
+                try:
+                    last_line = output_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if last_line is not None:
+                status_var.set(last_line.strip())
+                progress.step(2)
+            if reader.is_alive() or not output_queue.empty() or process.poll() is None:
+                progress_win.after(INSTALL_STATUS_MS, drain_output)
+                return
             
-            # Monitor output safely
-            if process and process.stdout:
-                while True:
-                    line = process.stdout.readline()
-                    if not line:
-                        break
-                    status_var.set(line.strip())
-                    progress_win.update()
-            
-            if process:
-                process.wait()
-                return_code = process.returncode
-            else:
-                status_var.set("Error: Failed to start installation process")
-                progress_win.update()
-                time.sleep(2)
-                progress.stop()
-                progress_win.destroy()
-                return False
-            
-            if return_code == 0:
+            if process.returncode == 0:
                 status_var.set("Installation completed successfully!")
-                progress.stop()
-                progress_win.update()
-                time.sleep(1)
-                progress_win.destroy()
-                return True
+                result["success"] = True
+                progress_win.after(1000, progress_win.destroy)
             else:
-                progress.stop()
                 messagebox.showerror("Installation Failed", 
                                    "Failed to set up the environment. Please try again or run install.py manually.")
                 progress_win.destroy()
-                return False
-                
-        except Exception as e:
-            progress.stop()
-            messagebox.showerror("Installation Error", str(e))
-            progress_win.destroy()
-            return False
+        
+        progress_win.after(INSTALL_STATUS_MS, drain_output)
+        # Keep the event loop running until the installer has finished
+        progress_win.wait_window()
+        # The installer may have created the venv
+        self._venv_exists = None
+        self._python_path = None
+        return result["success"]
         
     def create_widgets(self):
         # Main frame
@@ -621,10 +996,14 @@ class SpotifyPlaylistGeneratorGUI:
         console_frame = ttk.LabelFrame(main_frame, text="Console Output")
         console_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
-        # Console text widget with scrollbar - use light theme colors
-        self.console = scrolledtext.ScrolledText(console_frame, wrap=tk.WORD, height=CONSOLE_MIN_HEIGHT,
-                                             width=70, bg="#F8F8F8", fg="#333333", font=("Consolas", 9))
-        self.console.pack(fill=tk.BOTH, expand=True, padx=2, pady=5)
+        # Console text widget with scrollbar - use light theme colors. A plain Text plus
+        # Scrollbar instead of ScrolledText, no wrapper frame around the hot widget
+        self.console = tk.Text(console_frame, wrap=tk.WORD, height=CONSOLE_MIN_HEIGHT,
+                               width=70, bg="#F8F8F8", fg="#333333", font=("Consolas", 9))
+        console_scrollbar = ttk.Scrollbar(console_frame, command=self.console.yview)
+        self.console.configure(yscrollcommand=console_scrollbar.set)
+        console_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 2), pady=5)
+        self.console.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(2, 0), pady=5)
         self.console.config(state=tk.DISABLED)
         
         # Resize handle
@@ -636,16 +1015,15 @@ class SpotifyPlaylistGeneratorGUI:
         """Copy selected text from console to clipboard"""
         try:
             selected_text = self.console.get(tk.SEL_FIRST, tk.SEL_LAST)
-            self.root.clipboard_clear()
-            self.root.clipboard_append(selected_text)
+            set_clipboard(self.root, selected_text)
         except tk.TclError:
             pass  # No selection
     
     def copy_all_text(self):
         """Copy all text from console to clipboard"""
+        self._flush_log()
         all_text = self.console.get(1.0, tk.END)
-        self.root.clipboard_clear()
-        self.root.clipboard_append(all_text)
+        set_clipboard(self.root, all_text)
     
     def select_all_text(self):
         """Select all text in the console"""
@@ -660,12 +1038,25 @@ class SpotifyPlaylistGeneratorGUI:
     def on_resize(self, event=None):
         """Handle window resize events"""
         if event and event.widget == self.root:
-            # Only respond when the entire window resizes, not when child widgets resize
-            current_height = self.root.winfo_height()
-            if current_height > INITIAL_WINDOW_HEIGHT + 50:  # Allow some buffer
-                self.expanded = True
-            else:
-                self.expanded = False
+            # Only respond when the entire window resizes, not when child widgets resize.
+            # Moving the window fires <Configure> too, skip events that don't change the size
+            size = (event.width, event.height)
+            if size == self._last_size:
+                return
+            self._last_size = size
+            # Tk fires <Configure> for every pixel of a drag, so wait until it settles.
+            if self._resize_after_id:
+                self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.root.after(75, self._do_resize_check)
+    
+    def _do_resize_check(self):
+        """Update the expanded flag once a resize gesture has finished"""
+        self._resize_after_id = None
+        current_height = self.root.winfo_height()
+        if current_height > INITIAL_WINDOW_HEIGHT + 50:  # Allow some buffer
+            self.expanded = True
+        else:
+            self.expanded = False
     
     def expand_window(self):
         """Expand the window to show more console output"""
@@ -686,26 +1077,42 @@ class SpotifyPlaylistGeneratorGUI:
         self.playlist_name.set(current_name)
         
     def load_recent_files(self):
-        """Load recent song files from history"""
+        """Load recent song files from history - the scan runs off the Tk thread"""
+        threading.Thread(target=self._scan_recent_files, daemon=True).start()
+    
+    def _scan_recent_files(self):
+        """Worker thread: collect recent song files, then hand them to the Tk thread"""
         try:
-            # Start with the default playlist file
             default_playlist_file = os.path.join(self.current_dir, "playlist.txt")
-            
-            # If playlist.txt exists in the current directory, add it as the default
-            if os.path.isfile(default_playlist_file):
-                self.songs_file_path.set(default_playlist_file)
-                
-                # Preload the playlist file path in the UI
-                self.recent_files = [default_playlist_file]
-                
-            # Look for other .txt files in the current directory to add to the dropdown
-            for file in os.listdir(self.current_dir):
-                if file.endswith(".txt") and file != "playlist.txt" and os.path.isfile(os.path.join(self.current_dir, file)):
-                    file_path = os.path.join(self.current_dir, file)
-                    if file_path not in self.recent_files:
-                        self.recent_files.append(file_path)
-        except Exception as e:
-            pass  # Ignore errors in populating recent files
+            # Only stat the few remembered paths, scan the directory just when there is no history yet
+            files = read_recent_files()
+            if files:
+                if default_playlist_file not in files:
+                    default_playlist_file = None
+            else:
+                files = scan_txt_files(self.current_dir)
+                # playlist.txt is the default, then the other .txt files, most recently modified first
+                if default_playlist_file in files:
+                    files.remove(default_playlist_file)
+                    files.insert(0, default_playlist_file)
+                else:
+                    default_playlist_file = None
+                if files:
+                    write_recent_files(files)
+        except Exception:
+            return  # Ignore errors in populating recent files
+        try:
+            self.root.after(0, self._apply_recent_files, files, default_playlist_file)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while scanning
+    
+    def _apply_recent_files(self, files, default_playlist_file):
+        """Take over the scanned recent files, keeping anything browsed in the meantime"""
+        for file_path in files:
+            if file_path not in self.recent_files:
+                self.recent_files.append(file_path)
+        if default_playlist_file and not self.songs_file_path.get():
+            self.songs_file_path.set(default_playlist_file)
             
     def start_file_monitoring(self, file_path):
         """Start monitoring a file for changes"""
@@ -714,28 +1121,38 @@ class SpotifyPlaylistGeneratorGUI:
             if hasattr(self, 'monitoring_job') and self.monitoring_job:
                 self.root.after_cancel(self.monitoring_job)
                 self.monitoring_job = None
+            stop_watching(getattr(self, 'file_observer', None))
+            self.file_observer = None
         
         self.monitored_file = file_path
-        self.last_modified_time = os.path.getmtime(file_path) if os.path.exists(file_path) else 0
+        st = stat_or_none(file_path)
+        self.last_modified_time = st.st_mtime_ns if st else 0
         
-        # Start the monitoring job
-        self.monitoring_job = self.root.after(1000, self.check_file_changes)
+        # Let the OS notify us about changes, poll every second only without watchdog
+        self.file_observer = watch_file(self.root, file_path, self.on_monitored_file_changed)
+        if self.file_observer is None:
+            self.monitoring_job = self.root.after(1000, self.check_file_changes)
+    
+    def on_monitored_file_changed(self):
+        """Notify the user after the watcher reported a change to the selected file"""
+        if self.monitored_file == self.songs_file_path.get():
+            self.status_var.set("File updated externally")
+            messagebox.showinfo("File Updated", 
+                              f"The file {os.path.basename(self.monitored_file)} has been updated externally.")
         
     def check_file_changes(self):
         """Check if the monitored file has changed"""
         try:
-            if hasattr(self, 'monitored_file') and os.path.exists(self.monitored_file):
-                current_modified_time = os.path.getmtime(self.monitored_file)
+            st = stat_or_none(self.monitored_file) if hasattr(self, 'monitored_file') else None
+            if st and st.st_mtime_ns != self.last_modified_time:
+                # File has been modified
+                self.last_modified_time = st.st_mtime_ns
                 
-                if current_modified_time != self.last_modified_time:
-                    # File has been modified
-                    self.last_modified_time = current_modified_time
-                    
-                    # If this is the currently selected file, update the UI to reflect changes
-                    if self.monitored_file == self.songs_file_path.get():
-                        self.status_var.set("File updated externally")
-                        messagebox.showinfo("File Updated", 
-                                          f"The file {os.path.basename(self.monitored_file)} has been updated externally.")
+                # If this is the currently selected file, update the UI to reflect changes
+                if self.monitored_file == self.songs_file_path.get():
+                    self.status_var.set("File updated externally")
+                    messagebox.showinfo("File Updated", 
+                                      f"The file {os.path.basename(self.monitored_file)} has been updated externally.")
         except Exception as e:
             pass  # Ignore errors in file monitoring
         
@@ -744,6 +1161,7 @@ class SpotifyPlaylistGeneratorGUI:
     
     def browse_file(self):
         """Open file dialog to select a playlist file"""
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select Playlist File",
             filetypes=[
@@ -764,62 +1182,37 @@ class SpotifyPlaylistGeneratorGUI:
                 self.recent_files.insert(0, file_path)
                 if len(self.recent_files) > 3:
                     self.recent_files.pop()
+                try:
+                    write_recent_files(self.recent_files)
+                except OSError:
+                    pass  # History is a convenience, never fail the file selection
     
-    def check_environment(self):
-        """Check if the environment is set up correctly"""
-        self.write_to_console("Checking environment...\n")
-        
-        # Check for virtual environment
-        venv_exists = os.path.exists(self.venv_dir)
-        
-        # Check for .env file with credentials
-        env_exists = os.path.exists(self.env_path)
-        
-        # Check for valid credentials
-        has_credentials = self.has_valid_credentials() if env_exists else False
-        
-        # Log status
-        env_status = []
-        if not venv_exists:
-            env_status.append("- Virtual environment not found")
-        if not env_exists:
-            env_status.append("- .env file with Spotify credentials not found")
-        elif not has_credentials:
-            env_status.append("- Spotify credentials need to be set up")
-            
-        if env_status:
-            self.write_to_console("Environment issues:\n")
-            for status in env_status:
-                self.write_to_console(f"{status}\n")
-                
-            if not venv_exists:
-                self.write_to_console("\nRecommended: Run setup by executing install.py\n")
-                
-            if not has_credentials:
-                self.write_to_console("\nRecommended: Click 'Setup Credentials' button\n")
-        else:
-            self.write_to_console("Environment check completed.\n")
+    def venv_exists(self):
+        """Check for the virtual environment, remembered until the next installation"""
+        if self._venv_exists is None:
+            self._venv_exists = os.path.isdir(self.venv_dir)
+        return self._venv_exists
     
-    def has_valid_credentials(self):
+    def has_valid_credentials(self, st=None):
         """Check if the .env file has valid credentials"""
         try:
-            client_id = None
-            client_secret = None
-            redirect_uri = None
-            
-            with open(self.env_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("SPOTIPY_CLIENT_ID="):
-                        _, client_id = line.split("=", 1)
-                    elif line.startswith("SPOTIPY_CLIENT_SECRET="):
-                        _, client_secret = line.split("=", 1)
-                    elif line.startswith("SPOTIPY_REDIRECT_URI="):
-                        _, redirect_uri = line.split("=", 1)
-            
-            return client_id and client_secret and redirect_uri and \
-                   client_id != "your_client_id_here" and \
-                   client_secret != "your_client_secret_here"
+            if st is None:
+                st = stat_or_none(self.env_path)
+                if st is None:
+                    return False
+            # Unchanged file - reuse the previous verdict
+            cached = self._env_cache.get(self.env_path)
+            if cached and cached[0] == st.st_mtime_ns:
+                return cached[1]
+            values = load_env_cached(self.env_path, st)
+            client_id = values.get("SPOTIPY_CLIENT_ID")
+            client_secret = values.get("SPOTIPY_CLIENT_SECRET")
+            redirect_uri = values.get("SPOTIPY_REDIRECT_URI")
+            valid = bool(client_id and client_secret and redirect_uri and
+                         client_id not in ENV_PLACEHOLDERS and
+                         client_secret not in ENV_PLACEHOLDERS)
+            self._env_cache[self.env_path] = (st.st_mtime_ns, valid)
+            return valid
         except Exception:
             return False
     
@@ -827,32 +1220,65 @@ class SpotifyPlaylistGeneratorGUI:
         """Show dialog to set up Spotify API credentials"""
         dialog = SpotifyCredentialsDialog(self.root, self.env_path)
         self.root.wait_window(dialog)
+        if dialog.result:
+            # A save within the same mtime tick would otherwise keep the old verdict
+            self._env_cache.pop(self.env_path, None)
         return dialog.result
     
     def write_to_console(self, text):
         """Write text to the console widget"""
-        self.console.config(state=tk.NORMAL)
+        # Collect the text and insert it in one batch every CONSOLE_FLUSH_MS - nothing blocks
+        # the Tk thread anymore, so there is no need to flush inline and force a redraw
+        self._pending_log.append(text)
+        if not self._flush_job:
+            self._flush_job = self.root.after(CONSOLE_FLUSH_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Insert all pending console text with a single insert"""
+        self._flush_job = None
+        self._last_flush = time.monotonic()
+        if self._pending_log:
+            text = "".join(self._pending_log)
+            self._pending_log.clear()
+            self._append_console(text)
+    
+    def _make_console_writable(self):
+        """Enable the console for writing until output has been quiet for CONSOLE_IDLE_MS"""
+        if not self._console_busy:
+            self._console_busy = True
+            self.console.config(state=tk.NORMAL)
+            self.root.after(CONSOLE_IDLE_MS, self._console_idle)
+    
+    def _console_idle(self):
+        """Make the console read-only again once no output arrived for CONSOLE_IDLE_MS"""
+        idle_ms = (time.monotonic() - self._last_flush) * 1000
+        if idle_ms < CONSOLE_IDLE_MS:
+            self.root.after(int(CONSOLE_IDLE_MS - idle_ms) + 1, self._console_idle)
+            return
+        self._console_busy = False
+        self.console.config(state=tk.DISABLED)
+    
+    def _append_console(self, text):
+        """Append text to the console, dropping the oldest lines beyond CONSOLE_MAX_LINES"""
+        self._make_console_writable()
         self.console.insert(tk.END, text)
+        # Keep the Text widget bounded so inserts don't get slower over a long session
+        line_count = int(self.console.index("end-1c").split(".")[0])
+        if line_count > CONSOLE_MAX_LINES:
+            self.console.delete("1.0", f"{line_count - CONSOLE_MAX_LINES + 1}.0")
         self.console.see(tk.END)
-        self.console.config(state=tk.DISABLED)
-        self.root.update_idletasks()
     
     def clear_console(self):
         """Clear the console output"""
-        self.console.config(state=tk.NORMAL)
-        self.console.delete(1.0, tk.END)
-        self.console.config(state=tk.DISABLED)
+        self._pending_log.clear()
+        self._make_console_writable()
+        self.console.delete("1.0", tk.END)
     
     def create_playlist(self):
         """Create a Spotify playlist using Python directly"""
         try:
-            # Important: Move focus away from any entry field to ensure the StringVar gets updated
-            self.root.focus_set()
-            
-            # Force update to ensure all StringVar values are current
-            self.root.update_idletasks()
-            
-            # Directly get the value from the entry widget instead of the StringVar
+            # Directly get the value from the entry widget instead of the StringVar,
+            # so no focus change or idle pump is needed to have it up to date
             playlist_name = self.playlist_entry.get().strip()
             
             # Debug output for playlist name
@@ -874,7 +1300,7 @@ class SpotifyPlaylistGeneratorGUI:
                 return
             
             # Check environment
-            if not os.path.exists(self.venv_dir):
+            if not self.venv_exists():
                 if messagebox.askyesno("Environment Error", 
                                     "Virtual environment not found. Would you like to run the installation now?"):
                     success = self.run_installation()
@@ -884,38 +1310,38 @@ class SpotifyPlaylistGeneratorGUI:
                     return
             
             # Check for credentials
-            if not os.path.exists(self.env_path) or not self.has_valid_credentials():
+            if not self.has_valid_credentials():
                 if not self.show_credentials_dialog():
                     return
             
             # Clear console
             self.clear_console()
             
-            # Expand window to show more console output
-            self.expand_window()
-            
             # Update status
             self.status_var.set("Creating playlist...")
             self.create_button.config(state=tk.DISABLED)
             
             # Try using the shell script first since it's known to work on Linux/Mac
             if sys.platform == 'linux' or sys.platform.startswith('darwin'):
-                script_path = os.path.join(self.current_dir, "generate.sh")
+                script_path = self.shell_script_path
                 
-                # Verify script permissions
-                if not os.access(script_path, os.X_OK):
+                # Verify script permissions - one stat gives both existence and mode bits
+                st = stat_or_none(script_path)
+                is_exec = bool(st and st.st_mode & 0o111)
+                if st and not is_exec:
                     self.write_to_console("Warning: Shell script not executable, setting permissions...\n")
                     try:
-                        os.chmod(script_path, 0o755)  # rwxr-xr-x
+                        os.chmod(script_path, st.st_mode | 0o755)  # rwxr-xr-x
+                        is_exec = True
                     except Exception as e:
                         self.write_to_console(f"Error setting permissions: {e}\n")
                 
-                if os.path.exists(script_path) and os.access(script_path, os.X_OK):
+                if is_exec:
                     self.write_to_console("Using shell script method\n")
                     
-                    # Create a shell command with proper quoting for the arguments
-                    command_str = f"{script_path} '{playlist_name}' '{songs_file}'"
-                    success = self._run_command_and_process_output(["/bin/bash", "-c", command_str], playlist_name, songs_file)
+                    # Run the script directly, arguments are passed as-is without shell quoting
+                    command = [script_path, playlist_name, songs_file]
+                    success = self._run_command_and_process_output(command, playlist_name, songs_file)
                 else:
                     self.write_to_console("Shell script not executable, falling back to Python method\n")
                     success = self._create_playlist_using_python(playlist_name, songs_file)
@@ -923,28 +1349,40 @@ class SpotifyPlaylistGeneratorGUI:
                 # For Windows and other platforms, use Python method directly
                 success = self._create_playlist_using_python(playlist_name, songs_file)
                 
-            # Reset UI state
-            self.status_var.set("Ready")
-            self.create_button.config(state=tk.NORMAL)
+            # A started run resets the UI itself once the generator has finished
+            if not success:
+                self._reset_create_ui()
         except Exception as e:
             self.write_to_console(f"\n❌ Error: {str(e)}\n")
             self.status_var.set("Error")
             self.create_button.config(state=tk.NORMAL)
     
+    def _reset_create_ui(self):
+        """Make the UI ready for the next playlist"""
+        self.status_var.set("Ready")
+        self.create_button.config(state=tk.NORMAL)
+    
+    def _resolve_python(self):
+        """Interpreter for main.py - the venv's Python if it exists, remembered until the next installation"""
+        if self._python_path is None:
+            # Robust venv Python selection for all platforms, first existing candidate wins
+            if sys.platform == "win32":
+                candidates = (os.path.join(self.venv_dir, "Scripts", "python.exe"),)
+            else:
+                candidates = (os.path.join(self.venv_dir, "bin", "python"),
+                              os.path.join(self.venv_dir, "bin", "python3"))
+            # Fall back to the running interpreter if the venv has none
+            self._python_path = next((path for path in candidates if stat_or_none(path)), sys.executable)
+        return self._python_path
+    
     def _create_playlist_using_python(self, playlist_name, songs_file):
         """Execute the Python script directly"""
         self.write_to_console("Using Python method\n")
         
-        # Robust venv Python selection for all platforms
-        python_path = os.path.join(self.venv_dir, "bin", "python")
-        if sys.platform == "win32":
-            python_path = os.path.join(self.venv_dir, "Scripts", "python.exe")
-        if not os.path.exists(python_path):
-            # Only fallback if both venv paths are missing
-            python_path = sys.executable
+        python_path = self._resolve_python()
         
         # Get path to main.py script
-        script_path = os.path.join(self.current_dir, "main.py")
+        script_path = self.main_script_path
         if not os.path.exists(script_path):
             self.write_to_console("Error: main.py script not found!\n")
             return False
@@ -956,77 +1394,103 @@ class SpotifyPlaylistGeneratorGUI:
         return self._run_command_and_process_output(command, playlist_name, songs_file)
     
     def _run_command_and_process_output(self, command, playlist_name, songs_file):
-        """Run the command and process its output"""
+        """
+        Start the command and stream its output to the console.
+        A worker thread reads and formats the output, _drain_output moves it into the console and
+        calls _finish_command once the process has exited. Returns False if it could not be started.
+        """
         self.write_to_console(f"Starting playlist creation: {playlist_name}\n")
         self.write_to_console(f"Using songs from: {songs_file}\n\n")
         
         # Show exact command being executed (for debugging)
-        if isinstance(command, list) and command[0] == "/bin/bash":
-            self.write_to_console(f"Command: {command[2]}\n\n")
-        else:
-            self.write_to_console(f"Command: {' '.join(str(c) for c in command) if isinstance(command, list) else command}\n\n")
+        import shlex
+        self.write_to_console(f"Command: {' '.join(shlex.quote(str(c)) for c in command)}\n\n")
         
         # Run process
+        import subprocess
         try:
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
+        except Exception as e:
+            self.write_to_console(f"\n❌ Error: {str(e)}\n")
             
-            # Initialize playlist URL
-            playlist_url = None
-            
-            # Process output in real time - safely check stdout exists
-            if process and process.stdout:
-                # Read line by line
-                for line in iter(process.stdout.readline, ""):
-                    if not line:
-                        break
-                    clean_line = line.strip()
-                    
-                    # Strip ANSI color codes from terminal output
-                    # Matches color codes like [0;33m and [0m
-                    clean_line = re.sub(r'\x1b\[\d+(;\d+)*m', '', clean_line)
-                    
-                    # Format the output to make it more readable
-                    if "Prüfe Python-Umgebung" in clean_line:
-                        self.write_to_console("\n━━━ Environment Check ━━━\n")
-                        self.write_to_console(f"{clean_line}\n")
-                    elif "Starte Playlist-Erstellung" in clean_line:
-                        self.write_to_console("\n━━━ Creating Playlist ━━━\n")
-                        self.write_to_console(f"{clean_line}\n")
-                    elif "Playlist erstellt:" in clean_line or "Playlist-Link:" in clean_line:
-                        self.write_to_console("\n━━━ Playlist Created ━━━\n")
-                        self.write_to_console(f"✅ {clean_line}\n")
-                        
-                        # Extract URL
-                        url_match = re.search(r'https://open\.spotify\.com/playlist/\w+', clean_line)
-                        if url_match:
-                            playlist_url = url_match.group(0)
-                            print(f"Found playlist URL: {playlist_url}")
-                    elif "Gefunden via" in clean_line:
-                        self.write_to_console(f"✓ {clean_line}\n")
-                    elif "Batch hinzugefügt:" in clean_line or "Erfolgreich" in clean_line:
-                        self.write_to_console("\n━━━ Summary ━━━\n")
-                        self.write_to_console(f"✅ {clean_line}\n")
-                    elif "Fehler:" in clean_line or "Error:" in clean_line:
-                        self.write_to_console(f"❌ {clean_line}\n")
-                    else:
-                        self.write_to_console(f"{clean_line}\n")
-            else:
-                self.write_to_console("Error: Could not capture process output\n")
+            # If shell script fails, try Python method directly instead of showing error
+            if sys.platform == 'linux' or sys.platform.startswith('darwin'):
+                if command[0] == self.shell_script_path:
+                    self.write_to_console("\nTrying alternative method with Python...\n")
+                    return self._create_playlist_using_python(playlist_name, songs_file)
             
-            # Wait for process to complete
-            if process:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return False
+        
+        # Reading and formatting happen off the Tk thread
+        output_queue = queue.Queue()
+        threading.Thread(target=self._read_output, args=(process, output_queue), daemon=True).start()
+        self.root.after(30, self._drain_output, output_queue, playlist_name)
+        return True
+    
+    def _read_output(self, process, output_queue):
+        """Worker thread: read the generator output in chunks and queue formatted console text"""
+        playlist_url = None
+        try:
+            fd = process.stdout.fileno()
+            pending = b""
+            while True:
+                chunk = os.read(fd, 65536)
+                if chunk:
+                    pending += chunk
+                    cut = pending.rfind(b"\n")
+                    if cut == -1:
+                        continue
+                    lines = pending[:cut].decode("utf-8", "replace").splitlines()
+                    pending = pending[cut + 1:]
+                else:
+                    # End of output, flush a last line without newline
+                    lines = [pending.decode("utf-8", "replace")] if pending else []
+                parts = []
+                for line in lines:
+                    text, url = format_output_line(line)
+                    parts.append(text)
+                    playlist_url = url or playlist_url
+                if parts:
+                    output_queue.put("".join(parts))
+                if not chunk:
+                    break
+            process.stdout.close()
+        finally:
+            # Final item: (return code, playlist URL) - at EOF the process has usually exited already
+            return_code = process.poll()
+            if return_code is None:
                 return_code = process.wait()
-            else:
-                self.write_to_console("Error: Process failed to start\n")
-                return False
-            
+            output_queue.put((return_code, playlist_url))
+    
+    def _drain_output(self, output_queue, playlist_name):
+        """Move queued output into the console with one write, reschedules itself until the run is over"""
+        texts = []
+        result = None
+        while True:
+            try:
+                item = output_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                result = item
+                break
+            texts.append(item)
+        if texts:
+            self.write_to_console("".join(texts))
+        if result is None:
+            self.root.after(30, self._drain_output, output_queue, playlist_name)
+            return
+        self._finish_command(playlist_name, *result)
+    
+    def _finish_command(self, playlist_name, return_code, playlist_url):
+        """Report the result of a finished generator run and reset the UI"""
+        try:
             # Display results
             if return_code == 0:
                 self.write_to_console("\n✅ Playlist created successfully!\n")
@@ -1034,35 +1498,26 @@ class SpotifyPlaylistGeneratorGUI:
                     self.write_to_console(f"Playlist URL: {playlist_url}\n")
                     # Ask if user wants to open the playlist
                     if messagebox.askyesno("Success", f"Playlist '{playlist_name}' created successfully! Open in browser?"):
+                        import webbrowser
                         webbrowser.open(playlist_url)
                 return True
             else:
                 self.write_to_console(f"\n❌ Error: Process exited with code {return_code}\n")
                 messagebox.showerror("Error", f"Failed to create playlist. Exit code: {return_code}")
                 return False
-        
-        except Exception as e:
-            self.write_to_console(f"\n❌ Error: {str(e)}\n")
-            
-            # If shell script fails, try Python method directly instead of showing error
-            if sys.platform == 'linux' or sys.platform.startswith('darwin'):
-                if isinstance(command, list) and len(command) > 0 and command[0] == "/bin/bash":
-                    self.write_to_console("\nTrying alternative method with Python...\n")
-                    return self._create_playlist_using_python(playlist_name, songs_file)
-            
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            return False
+        finally:
+            self._reset_create_ui()
 
-def create_splash_screen():
-    """Create a splash screen while the app loads"""
-    splash = tk.Tk()
+def create_splash_screen(root):
+    """Create a splash screen on top of the (hidden) root window while the app loads"""
+    splash = tk.Toplevel(root)
     splash.withdraw()  # Hide initially to prevent flicker
     splash.title("")
     splash.overrideredirect(True)  # No window decorations
     # Calculate position
     width = 350
     height = 180
-    x, y = get_mouse_monitor_geometry(width, height)
+    x, y, _ = get_mouse_monitor_geometry(width, height)
     splash.geometry(f'{width}x{height}+{x}+{y}')
     splash.configure(bg="#121212")  # Spotify dark background
     
@@ -1079,38 +1534,19 @@ def create_splash_screen():
                     fg="white", bg="#121212")
     label2.pack()
     
-    # Create progress bar
-    progress_frame = tk.Frame(frame, bg="#121212", height=10, width=250)
-    progress_frame.pack(pady=15)
-    
-    progress_bar = tk.Canvas(progress_frame, width=250, height=8, bg="#333333", 
-                          highlightthickness=0)
-    progress_bar.pack()
-    
-    # Draw progress bar and initialize variables for animation
-    progress_position = [0]  # Use list for mutable reference
-    bar = progress_bar.create_rectangle(0, 0, 0, 8, fill="#1DB954", width=0)
-    
-    # Safe animation function
-    splash_state = {"timer_id": None}
-    def animate_progress():
-        if not splash.winfo_exists():
-            return
-        progress_position[0] = (progress_position[0] + 5) % 250
-        try:
-            progress_bar.coords(bar, 0, 0, progress_position[0], 8)
-            if splash_state["timer_id"]:
-                splash.after_cancel(splash_state["timer_id"])
-            splash_state["timer_id"] = splash.after(30, animate_progress)
-        except tk.TclError:
-            pass
+    # Progress bar - a ttk.Progressbar animated by Tk itself instead of a Canvas redrawn from Python
+    style = ttk.Style(splash)
+    style.configure("Splash.Horizontal.TProgressbar", troughcolor="#333333", background="#1DB954",
+                    bordercolor="#333333", lightcolor="#1DB954", darkcolor="#1DB954", thickness=8)
+    progress_bar = ttk.Progressbar(frame, style="Splash.Horizontal.TProgressbar",
+                                   mode="indeterminate", length=250)
+    progress_bar.pack(pady=15)
     
     # Create cleanup function
+    splash_state = {}
     def cleanup():
         try:
-            if splash_state["timer_id"]:
-                splash.after_cancel(splash_state["timer_id"])
-                splash_state["timer_id"] = None
+            progress_bar.stop()
         except Exception:
             pass
     
@@ -1119,7 +1555,7 @@ def create_splash_screen():
     # Show splash and start animation
     splash.deiconify()
     splash.update()
-    splash_state["timer_id"] = splash.after(30, animate_progress)
+    progress_bar.start(SPLASH_FRAME_MS)
     
     return splash, splash_state
 
@@ -1128,19 +1564,28 @@ def main():
     splash_state = None
     root = None
     try:
-        splash, splash_state = create_splash_screen()
-        splash.update()
+        # One Tk interpreter for splash and app - the root stays hidden while the splash shows
+        root = tk.Tk()
+        root.withdraw()
+        splash, splash_state = create_splash_screen(root)
+        
+        # ensure_venv_ready calls back from its worker thread, so only set a flag there
+        # and build the GUI from the Tk thread
+        venv_ready = threading.Event()
         def start_gui():
+            if not venv_ready.is_set():
+                root.after(50, start_gui)
+                return
             if splash and splash.winfo_exists():
                 if splash_state and "cleanup" in splash_state:
                     splash_state["cleanup"]()
                 splash.destroy()
-            root = tk.Tk()
+            root.deiconify()
             app = SpotifyPlaylistGeneratorGUI(root)
             app.load_recent_files()
-            root.mainloop()
-        ensure_venv_ready(start_gui)
-        splash.mainloop()
+        ensure_venv_ready(venv_ready.set)
+        root.after(50, start_gui)
+        root.mainloop()
     except Exception as e:
         if root and root.winfo_exists():
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
@@ -11,6 +11,10 @@ import os
 import shutil
 import sys
 import subprocess
+import threading
+import time
+import hashlib
+import tarfile
 from pathlib import Path
 import platform
 
@@ -19,18 +23,96 @@ is_windows = platform.system().lower() == 'windows'
 # Current directory
 current_dir = os.path.abspath(os.path.dirname(__file__))
 venv_dir = os.path.join(current_dir, "venv_spotify")
+requirements_path = os.path.join(current_dir, "requirements.txt")
+# Wheels downloaded while the venv is being created, pip install picks them up from here
+wheel_cache = os.path.join(os.path.expanduser("~"), ".cache", "spotylist", "wheels")
+# Environment for every pip run - pip's own (persistent, per-platform) cache stays where it is
+pip_env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
 
 print("Setting up Spotify Playlist Generator...")
 
+if not os.path.exists(requirements_path):
+    print("ERROR: requirements.txt not found! Please make sure it exists in the project directory.")
+    sys.exit(1)
+
+def warm_wheel_cache():
+    """Download the pinned requirements into wheel_cache - best effort, pip install falls back to PyPI"""
+    try:
+        subprocess.run([sys.executable, "-m", "pip", "download", "--disable-pip-version-check",
+                        "--no-input", "--progress-bar=off", "--no-deps", "--prefer-binary",
+                        "--dest", wheel_cache, "-r", requirements_path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=pip_env)
+    except Exception:
+        pass
+
+def create_venv():
+    """Create venv_dir - with virtualenv if it is installed (links pip & co. from its app-data cache), stdlib venv otherwise"""
+    try:
+        subprocess.run([sys.executable, "-m", "virtualenv", "--seeder=app-data", "--symlink-app-data", venv_dir],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    except (OSError, subprocess.CalledProcessError):
+        pass  # No virtualenv, or symlinks not allowed here
+    subprocess.run([sys.executable, "-m", "venv", venv_dir], check=True)
+
+# A freshly installed venv is packed into a snapshot, so the next install into the same place
+# (e.g. after deleting venv_spotify) is one unpack instead of venv + pip. Venvs contain absolute
+# paths and interpreter links, so the key covers the location and the interpreter, not just the requirements
+snapshot_key = hashlib.sha256("\n".join([Path(requirements_path).read_text(encoding="utf-8"), venv_dir,
+                                         sys.executable, sys.version]).encode()).hexdigest()[:16]
+venv_snapshot = os.path.join(os.path.expanduser("~"), ".cache", "spotylist", f"venv-{snapshot_key}.tar.gz")
+
+def restore_venv_snapshot():
+    """Unpack venv_snapshot into current_dir, returns False (and leaves no partial venv) if that fails"""
+    try:
+        with tarfile.open(venv_snapshot) as tar:
+            # Our own archive - keep the venv's interpreter symlinks as they are
+            if hasattr(tarfile, "fully_trusted_filter"):
+                tar.extractall(current_dir, filter="fully_trusted")
+            else:
+                tar.extractall(current_dir)
+        return True
+    except Exception as e:
+        print(f"Warning: Could not restore the venv snapshot: {e}")
+        shutil.rmtree(venv_dir, ignore_errors=True)
+        return False
+
+def save_venv_snapshot():
+    """Pack venv_dir into venv_snapshot - best effort, written to a temp file and renamed into place"""
+    tmp_path = venv_snapshot + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(venv_snapshot), exist_ok=True)
+        with tarfile.open(tmp_path, "w:gz", compresslevel=3) as tar:
+            tar.add(venv_dir, arcname=os.path.basename(venv_dir))
+        os.replace(tmp_path, venv_snapshot)
+        print("Saved a snapshot of the environment for faster reinstalls.")
+    except Exception as e:
+        print(f"Warning: Could not save a venv snapshot: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 # Set up Python virtual environment
 print("Creating Python virtual environment...")
+warmup = None
+venv_created = venv_restored = False
 if not os.path.exists(venv_dir):
-    try:
-        subprocess.run([sys.executable, "-m", "venv", venv_dir], check=True)
-        print("Virtual environment created successfully.")
-    except Exception as e:
-        print(f"Error creating virtual environment: {e}")
-        sys.exit(1)
+    if os.path.isfile(venv_snapshot):
+        venv_restored = restore_venv_snapshot()
+        if venv_restored:
+            print("Virtual environment restored from snapshot.")
+    if not venv_restored:
+        # Overlap the network-bound download with the local venv bootstrap
+        warmup = threading.Thread(target=warm_wheel_cache, daemon=True)
+        warmup.start()
+        try:
+            create_venv()
+            venv_created = True
+            print("Virtual environment created successfully.")
+        except Exception as e:
+            print(f"Error creating virtual environment: {e}")
+            sys.exit(1)
 else:
     print("Virtual environment already exists.")
 
@@ -43,18 +125,36 @@ else:
     pip_path = os.path.join(venv_dir, "bin", "pip")
     python_path = os.path.join(venv_dir, "bin", "python")
 
-requirements_path = os.path.join(current_dir, "requirements.txt")
-if not os.path.exists(requirements_path):
-    print("ERROR: requirements.txt not found! Please make sure it exists in the project directory.")
-    sys.exit(1)
+if warmup:
+    warmup.join()
+find_links = ["--find-links", wheel_cache] if os.path.isdir(wheel_cache) else []
 
+# Upgrading pip means a PyPI round trip - done at most once per PIP_CHECK_TTL per venv
+PIP_CHECK_TTL = 24 * 60 * 60
+pip_sentinel = os.path.join(venv_dir, ".pip_checked")
 try:
-    subprocess.run([python_path, "-m", "pip", "install", "--upgrade", "pip"], check=True)
-    subprocess.run([python_path, "-m", "pip", "install", "-r", requirements_path], check=True)
-    print("All dependencies installed successfully from requirements.txt.")
-except Exception as e:
-    print(f"Error installing dependencies: {e}")
-    sys.exit(1)
+    upgrade_pip = time.time() - os.stat(pip_sentinel).st_mtime >= PIP_CHECK_TTL
+except FileNotFoundError:
+    upgrade_pip = True
+
+if venv_restored:
+    print("Dependencies restored from snapshot.")
+else:
+    try:
+        # One pip run upgrades pip (plus wheel, so source-only packages get built and cached as wheels)
+        # and installs the requirements - pays the pip startup only once
+        subprocess.run([python_path, "-m", "pip", "install", "--upgrade",
+                        "--disable-pip-version-check", "--no-input", "--progress-bar=off", "--prefer-binary",
+                        *find_links, *(["pip", "wheel"] if upgrade_pip else []), "-r", requirements_path],
+                       check=True, env=pip_env)
+        if upgrade_pip:
+            Path(pip_sentinel).touch()
+        print("All dependencies installed successfully from requirements.txt.")
+    except Exception as e:
+        print(f"Error installing dependencies: {e}")
+        sys.exit(1)
+    if venv_created:
+        save_venv_snapshot()
 
 # Create a sample .env file if not present
 env_path = os.path.join(current_dir, ".env")
@@ -79,23 +179,21 @@ if not is_windows:
         os.path.join(current_dir, "debug_test.py")
     ]
     for file_path in executable_files:
-        if os.path.exists(file_path):
-            try:
-                current_mode = os.stat(file_path).st_mode
-                new_mode = current_mode | ((current_mode & 0o444) >> 2)
+        try:
+            # One stat doubles as the existence check, chmod only when an exec bit is missing
+            current_mode = os.stat(file_path).st_mode
+            new_mode = current_mode | ((current_mode & 0o444) >> 2)
+            if new_mode != current_mode:
                 os.chmod(file_path, new_mode)
                 print(f"Made {os.path.basename(file_path)} executable.")
-            except Exception as e:
-                print(f"Warning: Could not set permissions for {os.path.basename(file_path)}: {e}")
-        else:
+        except FileNotFoundError:
             print(f"Warning: File not found: {os.path.basename(file_path)}")
+        except Exception as e:
+            print(f"Warning: Could not set permissions for {os.path.basename(file_path)}: {e}")
 
 # Create a desktop shortcut on Windows to launch the app with pythonw.exe (no terminal window)
 if is_windows:
     try:
-        import sys
-        import os
-        venv_dir = os.path.join(current_dir, "venv_spotify")
         pythonw_path = os.path.join(venv_dir, "Scripts", "pythonw.exe")
         script_path = os.path.join(current_dir, "Spotify_Playlist_Generator.py")
         desktop = os.path.join(os.path.join(os.environ['USERPROFILE']), 'Desktop')
@@ -105,8 +203,7 @@ if is_windows:
         try:
             import win32com.client
         except ImportError:
-            pip_path = os.path.join(venv_dir, "Scripts", "pip.exe")
-            subprocess.run([pip_path, "install", "pywin32"], check=True)
+            subprocess.run([pip_path, "install", "--prefer-binary", "pywin32"], check=True, env=pip_env)
             import win32com.client
 
         shell = win32com.client.Dispatch('WScript.Shell')
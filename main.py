@@ -14,7 +14,7 @@ So i created something you can input an AI generated Song List.
 What it does:
 - Creates Spotify playlists from text files with minimal effort
 - Handles artist-title formats, URLs, or Spotify IDs - whatever you throw at it
-- Tries really hard to find the right songs with multiple search strategies
+- Tries really hard to find the right songs - one search, then the closest match wins
 - Processes songs in batches so large playlists don't crash
 
 For the easy way, just use the GUI: use the shortcut 'Spotify Playlist Generator' (Windows) or run:
@@ -27,6 +27,11 @@ import sys
 import os
 import time
 import re
+import atexit
+import shelve
+import threading
+from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from dotenv import load_dotenv
@@ -44,81 +49,185 @@ if not sys.prefix.startswith(venv_path):
           "On Windows: venv_spotify\\Scripts\\python.exe main.py\n")
     sys.exit(1)
 
-# Logging stuff - because I like to know what's happening
+# Logging stuff - because I like to know what's happening.
+# The log file stays open for the whole run (line-buffered) instead of being reopened for every message
+try:
+    _LOG_FH = open("spotify_playlist.log", "a", encoding="utf-8", errors="replace", buffering=1)
+    atexit.register(_LOG_FH.close)
+except OSError:
+    _LOG_FH = None  # Read-only working directory - log to the console only
+
+# (second, formatted timestamp) - a burst of log lines within one second formats the time once.
+# Swapped as a whole tuple, so concurrent log() calls from the search threads at worst format it twice
+_last_timestamp = (0, "")
+
 def log(message: str) -> None:
     """
     Adds timestamps to messages and saves them to a log file.
     Handles Unicode safely for all platforms and Python versions.
     """
-    import platform
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    global _last_timestamp
+    now = int(time.time())
+    second, timestamp = _last_timestamp
+    if now != second:
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _last_timestamp = (now, timestamp)
     entry = f"{timestamp} - {message}"
-    # Print to console, replacing non-encodable chars (robust for all Python versions)
+    # Print to console, replacing non-encodable chars (robust for all Python versions).
+    # Line and newline go out in one write, so lines logged from the search threads don't interleave
     try:
-        print(entry, flush=True)
+        print(entry + "\n", end="", flush=True)
     except Exception:
         try:
-            print(entry.encode('utf-8', errors='replace').decode('utf-8', errors='replace'), flush=True)
+            print(entry.encode('utf-8', errors='replace').decode('utf-8', errors='replace') + "\n", end="", flush=True)
         except Exception:
-            print(entry.encode('ascii', errors='replace').decode('ascii', errors='replace'), flush=True)
+            print(entry.encode('ascii', errors='replace').decode('ascii', errors='replace') + "\n", end="", flush=True)
     # Write to log file, always as UTF-8
-    encoding = 'utf-8'
-    with open("spotify_playlist.log", "a", encoding=encoding, errors='replace') as f:
-        f.write(entry + "\n")
+    if _LOG_FH is not None:
+        _LOG_FH.write(entry + "\n")
+
+SEARCH_WORKERS = 8  # Searches in flight at once - each one is mostly waiting on an HTTPS round trip
+API_RETRIES = 4  # Attempts per search/add when Spotify answers with HTTP 429 (rate limited)
+SEARCH_CANDIDATES = 5  # Results fetched per search and re-ranked locally
+MIN_MATCH_SCORE = 70  # Best candidate must be at least this similar (0-100) to the input line
+
+# Compiled once - used for every line of the input file. One pass covers all three formats:
+# a bare Spotify ID (the whole line), a spotify:track: URI or an open.spotify.com track URL
+_RE_ANY_ID = re.compile(r"^([A-Za-z0-9]{22})$|spotify:track:([A-Za-z0-9]{22})|open\.spotify\.com/track/([A-Za-z0-9]{22})")
+_RE_PUNCT = re.compile(r'[^\w\s]')
+
+# Search results from earlier runs: normalized line -> (track ID or "" if not found, time of the search)
+SEARCH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "spotylist", "search.db")
+MISS_RETRY_SECONDS = 7 * 24 * 60 * 60  # "Not found" is searched again after a week - the catalog grows
+
+def _open_search_cache():
+    """Open the on-disk search cache, or return None if it can't be used (read-only home, locked db...)"""
+    try:
+        os.makedirs(os.path.dirname(SEARCH_CACHE_PATH), exist_ok=True)
+        cache = shelve.open(SEARCH_CACHE_PATH)
+    except Exception:
+        return None
+    atexit.register(cache.close)
+    return cache
+
+_search_cache = _open_search_cache()
+_search_cache_lock = threading.Lock()  # shelve isn't thread-safe, searches run in a pool
+
+def _similarity(a: str, b: str) -> float:
+    """How alike two normalized strings are (0-100), ignoring word order and extra words like "Remastered" """
+    # Same idea as rapidfuzz's token_set_ratio: compare the shared words against each side's full word set
+    words_a, words_b = set(a.split()), set(b.split())
+    common = " ".join(sorted(words_a & words_b))
+    full_a = f"{common} {' '.join(sorted(words_a - words_b))}".strip()
+    full_b = f"{common} {' '.join(sorted(words_b - words_a))}".strip()
+    return max(SequenceMatcher(None, x, y).ratio()
+               for x, y in ((common, full_a), (common, full_b), (full_a, full_b))) * 100
+
+def _rate_limited(call, *args, **kwargs):
+    """call(*args, **kwargs), waiting out Spotify's rate limit instead of failing"""
+    for attempt in range(API_RETRIES):
+        try:
+            return call(*args, **kwargs)
+        except spotipy.SpotifyException as e:
+            if e.http_status != 429 or attempt == API_RETRIES - 1:
+                raise
+            retry_after = str((e.headers or {}).get("Retry-After", ""))
+            time.sleep(int(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+def _search(sp: spotipy.Spotify, q: str) -> dict:
+    """sp.search for track candidates"""
+    # With a market set, Spotify leaves out the ~180-entry available_markets list of every track
+    # (and only returns tracks the user can actually play)
+    return _rate_limited(sp.search, q=q, type="track", limit=SEARCH_CANDIDATES, market="from_token")
 
 # The search magic - this took me forever to get right!
 def search_track_id(sp: spotipy.Spotify, query: str) -> str:
     """
-    My not-so-secret sauce for finding tracks. If one method fails, try another!
+    My not-so-secret sauce for finding tracks.
     
-    I learned the hard way that the Spotify API can be picky, so I built this
-    with three fallback strategies:
-    1. The precise approach: Try artist and title separately for exact matches 
-    2. The straightforward approach: Just search the whole string
-    3. The desperate approach: Strip special characters and try again
-    
-    # TODO: Maybe add some fuzzy matching? Sometimes the titles have typos...
+    It used to be three searches in a row (precise, general, sanitized) - now it's one:
+    the line is stripped of special characters, Spotify returns a handful of candidates,
+    and the one whose "title artist" is most similar to the line wins. Typos are fine,
+    completely different songs are not (see MIN_MATCH_SCORE).
     """
-    track_id = None
-    
     try:
-        # First attempt - the proper way
-        if " - " in query:
-            track_name, artist = query.split(" - ", 1)
-            result = sp.search(q=f'track:"{track_name}" artist:"{artist}"', type="track", limit=1)
-            if result and "tracks" in result and "items" in result["tracks"] and result["tracks"]["items"]:
-                track_id = result["tracks"]["items"][0]["id"]
-                log(f"Found with precise search: {query}")
+        # Strip those pesky special characters - the " - " separator goes with them
+        query_norm = " ".join(_RE_PUNCT.sub(" ", query).lower().split())
+        if not query_norm:
+            log(f"Couldn't find: {query} - maybe check the spelling?")
+            return ""
+        
+        # Known from an earlier run? Misses only count until they are MISS_RETRY_SECONDS old
+        if _search_cache is not None:
+            with _search_cache_lock:
+                cached = _search_cache.get(query_norm)
+            if cached and (cached[0] or time.time() - cached[1] < MISS_RETRY_SECONDS):
+                if cached[0]:
+                    log(f"Found (cached): {query}")
+                else:
+                    log(f"Couldn't find: {query} - maybe check the spelling? (cached)")
+                return cached[0]
         
-        # Second attempt - just throw the whole thing at Spotify
-        if not track_id:
-            result = sp.search(q=query, type="track", limit=1)
-            if result and "tracks" in result and "items" in result["tracks"] and result["tracks"]["items"]:
-                track_id = result["tracks"]["items"][0]["id"]
-                log(f"Found with general search: {query}")
+        result = _search(sp, query_norm)
+        try:
+            items = result["tracks"]["items"] or ()
+        except (KeyError, TypeError):  # No result or an unexpected shape - same as no hits
+            items = ()
         
-        # Last resort - clean up the text and try again
-        if not track_id and " - " in query:
-            track_name, artist = query.split(" - ", 1)
-            # Strip those pesky special characters 
-            clean_track = re.sub(r'[^\w\s]', '', track_name)
-            clean_artist = re.sub(r'[^\w\s]', '', artist)
-            result = sp.search(q=f'{clean_track} {clean_artist}', type="track", limit=1)
-            if result and "tracks" in result and "items" in result["tracks"] and result["tracks"]["items"]:
-                track_id = result["tracks"]["items"][0]["id"]
-                log(f"Found with sanitized search: {query}")
+        best_id, best_score = "", 0.0
+        for item in items:
+            if not item or not item.get("id"):
+                continue
+            try:
+                artist = item["artists"][0]["name"]
+            except (KeyError, IndexError, TypeError):
+                artist = ""
+            candidate = " ".join(_RE_PUNCT.sub(" ", f"{item.get('name', '')} {artist}").lower().split())
+            score = _similarity(query_norm, candidate)
+            if score > best_score:
+                best_id, best_score = item["id"], score
         
-        # If we still found nothing, admit defeat
-        if not track_id:
+        # If nothing is close enough, admit defeat
+        if best_score < MIN_MATCH_SCORE:
+            best_id = ""
             log(f"Couldn't find: {query} - maybe check the spelling?")
-            return ""
-            
-        return track_id
+        else:
+            log(f"Found (match {best_score:.0f}%): {query}")
+        
+        if _search_cache is not None:
+            with _search_cache_lock:
+                _search_cache[query_norm] = (best_id, time.time())
+        return best_id
         
     except Exception as e:
         log(f"Search error for '{query}': {e}")
         return ""
 
+def resolve_track_ids(sp: spotipy.Spotify, lines: list, pool: ThreadPoolExecutor):
+    """Yields (line, track ID or "") in file order - every search is submitted to pool up front"""
+    pending = []
+    for line in lines:
+        # Direct Spotify IDs, URIs like spotify:track:xxxx or URLs from the website/app - easy mode.
+        # Only the matching alternative has a group, lastindex points at it
+        id_match = _RE_ANY_ID.search(line)
+        if id_match:
+            pending.append((line, id_match.group(id_match.lastindex)))
+        else:
+            # The hard way - just "Artist - Song" format
+            pending.append((line, pool.submit(search_track_id, sp, line)))
+    for line, tid in pending:
+        yield line, tid if isinstance(tid, str) else tid.result()
+
+def add_batch(sp: spotipy.Spotify, playlist_id: str, batch: list) -> int:
+    """Appends one batch of up to 100 tracks to the playlist, exits the script if that fails"""
+    try:
+        _rate_limited(sp.playlist_add_items, playlist_id, batch)
+    except Exception as e:
+        log(f"Error adding tracks: {e}")
+        sys.exit(1)
+    log(f"Added batch of {len(batch)} tracks")
+    return len(batch)
+
 # Where the magic happens
 def main():
     """
@@ -207,60 +316,45 @@ def main():
 
     # Read the songs from the file
     try:
+        # One read, one strip per line; empty lines drop out
         with open(input_file, "r", encoding="utf-8") as f:
-            lines = [line.strip() for line in f if line.strip()]
+            lines = filter(None, map(str.strip, f.read().splitlines()))
+            # A repeated line would only find the same track again - drop it before any search runs
+            lines = list(dict.fromkeys(lines))
     except Exception as e:
         log(f"Error reading file '{input_file}': {e}")
         sys.exit(1)
 
-    # Find all the track IDs
-    track_ids = []
-    for line in lines:
-        # Look for different formats:
-        
-        # Direct Spotify IDs - easy mode
-        id_match = re.fullmatch(r"[A-Za-z0-9]{22}", line)
-        if id_match:
-            track_ids.append(line)
-            continue
-            
-        # Spotify URIs like spotify:track:xxxx
-        uri_match = re.search(r"spotify:track:([A-Za-z0-9]{22})", line)
-        if uri_match:
-            track_ids.append(uri_match.group(1))
-            continue
-            
-        # Spotify URLs from the website/app
-        http_match = re.search(r"open\.spotify\.com/track/([A-Za-z0-9]{22})", line)
-        if http_match:
-            track_ids.append(http_match.group(1))
-            continue
-            
-        # The hard way - just "Artist - Song" format
-        tid = search_track_id(sp, line)
-        if tid:
-            track_ids.append(tid)
-        else:
-            log(f"Couldn't find '{line}' - skipping this one")
+    # Resolve and add in one pass: all searches are queued on the pool at once, and the first full
+    # batches are already being added while the later ones still run (Spotify limit is 100 per request). Batches stay one after another:
+    # each batch is appended, so sending them concurrently would shuffle the file order
+    seen = set()  # Remove duplicates so we don't add the same song twice
+    batch = []
+    added = 0
+    log(f"Searching {len(lines)} lines - adding to playlist as tracks are found!")
+    pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+    try:
+        for line, tid in resolve_track_ids(sp, lines, pool):
+            if not tid:
+                log(f"Couldn't find '{line}' - skipping this one")
+                continue
+            if tid in seen:
+                continue
+            seen.add(tid)
+            batch.append(tid)
+            if len(batch) == 100:
+                added += add_batch(sp, playlist_id, batch)
+                batch = []
+        if batch:
+            added += add_batch(sp, playlist_id, batch)
+    finally:
+        # On an error exit, don't sit through the searches nobody will use
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    # Remove duplicates so we don't add the same song twice
-    unique_ids = list(dict.fromkeys(track_ids))
-    if not unique_ids:
+    if not added:
         log("No valid tracks found - check your input file")
         sys.exit(1)
-    log(f"Found {len(unique_ids)} unique tracks - adding to playlist!")
-
-    # Add songs in batches (Spotify limit is 100 per request)
-    for i in range(0, len(unique_ids), 100):
-        batch = unique_ids[i:i+100]
-        try:
-            sp.playlist_add_items(playlist_id, batch)
-            log(f"Added batch of {len(batch)} tracks")
-        except Exception as e:
-            log(f"Error adding tracks: {e}")
-            sys.exit(1)
-
-    log(f"Success! Added {len(unique_ids)} tracks to your playlist.")
+    log(f"Success! Added {added} tracks to your playlist.")
     
     # Print the playlist link so the GUI can grab it
     print(f"Playlist-Link: {playlist_url}", flush=True)
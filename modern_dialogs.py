@@ -2,10 +2,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import sys
-import webbrowser
 import subprocess
+import re
+from pathlib import Path
 
 from modern_spotify_gui import ModernConfig, ModernWidget
+from Spotify_Playlist_Generator import write_file_atomic
+
+# All three Spotify keys in one scan over the .env text ([ \t] instead of \s so a match never spans lines)
+_ENV_RE = re.compile(r'^[ \t]*SPOTIPY_(CLIENT_ID|CLIENT_SECRET|REDIRECT_URI)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+# Values of an unedited credentials template, shown as empty fields
+_ENV_PLACEHOLDERS = frozenset(("your_client_id_here", "your_client_secret_here"))
 
 class ModernDialog(tk.Toplevel):
     def __init__(self, parent, title="Dialog", width=480, height=340):
@@ -64,6 +71,9 @@ class ModernHelpDialog(ModernDialog):
         ok_btn.pack(side='right')
 
 class ModernCredentialsDialog(ModernDialog):
+    # Parsed .env per path: env_path -> (mtime_ns, size, {"CLIENT_ID": ..., ...}), shared by all dialogs
+    _cache = {}
+
     def __init__(self, parent, env_path):
         # Theme dynamisch wählen
         style_manager = getattr(parent, 'style_manager', None)
@@ -95,7 +105,7 @@ class ModernCredentialsDialog(ModernDialog):
         # Buttons für Dev-Portal und .env-Editor
         btnrow = tk.Frame(main, bg=colors['surface_container'], highlightthickness=0, bd=0)
         btnrow.pack(anchor='w', pady=(0, 10))
-        dev_btn = ModernWidget.create_modern_button(btnrow, text="🌐 Spotify Developer Portal", command=lambda: webbrowser.open("https://developer.spotify.com/dashboard"), style='secondary')
+        dev_btn = ModernWidget.create_modern_button(btnrow, text="🌐 Spotify Developer Portal", command=self.open_developer_portal, style='secondary')
         dev_btn.pack(side='left', padx=(0, 8))
         edit_btn = ModernWidget.create_modern_button(btnrow, text="📝 .env bearbeiten", command=self.open_env_in_editor, style='secondary')
         edit_btn.pack(side='left')
@@ -124,18 +134,25 @@ class ModernCredentialsDialog(ModernDialog):
 
     def load_existing_credentials(self):
         try:
-            if os.path.exists(self.env_path):
-                with open(self.env_path, "r") as f:
-                    for line in f:
-                        if line.startswith("SPOTIPY_CLIENT_ID="):
-                            _, value = line.strip().split("=", 1)
-                            self.client_id_var.set(value)
-                        elif line.startswith("SPOTIPY_CLIENT_SECRET="):
-                            _, value = line.strip().split("=", 1)
-                            self.client_secret_var.set(value)
-                        elif line.startswith("SPOTIPY_REDIRECT_URI="):
-                            _, value = line.strip().split("=", 1)
-                            self.redirect_uri_var.set(value)
+            try:
+                st = os.stat(self.env_path)
+            except FileNotFoundError:
+                return
+            # Reparse only if the file changed since the last dialog read or wrote it
+            cached = self._cache.get(self.env_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                values = cached[2]
+            else:
+                data = Path(self.env_path).read_text(encoding='utf-8')
+                values = dict(_ENV_RE.findall(data))
+                self._cache[self.env_path] = (st.st_mtime_ns, st.st_size, values)
+            targets = {
+                "CLIENT_ID": self.client_id_var,
+                "CLIENT_SECRET": self.client_secret_var,
+                "REDIRECT_URI": self.redirect_uri_var,
+            }
+            for key, value in values.items():
+                targets[key].set("" if value in _ENV_PLACEHOLDERS else value)
         except Exception:
             pass
 
@@ -147,11 +164,15 @@ class ModernCredentialsDialog(ModernDialog):
             messagebox.showwarning("Fehlende Daten", "Bitte Client ID und Secret eingeben.", parent=self)
             return
         try:
-            with open(self.env_path, "w") as f:
-                f.write("# Spotify API Credentials - Fill these values!\n")
-                f.write(f"SPOTIPY_CLIENT_ID={cid}\n")
-                f.write(f"SPOTIPY_CLIENT_SECRET={cs}\n")
-                f.write(f"SPOTIPY_REDIRECT_URI={ru}\n")
+            content = ("# Spotify API Credentials - Fill these values!\n"
+                       f"SPOTIPY_CLIENT_ID={cid}\n"
+                       f"SPOTIPY_CLIENT_SECRET={cs}\n"
+                       f"SPOTIPY_REDIRECT_URI={ru}\n")
+            write_file_atomic(self.env_path, content)
+            # The next dialog can take the values from here instead of rereading the file
+            st = os.stat(self.env_path)
+            self._cache[self.env_path] = (st.st_mtime_ns, st.st_size,
+                                          {"CLIENT_ID": cid, "CLIENT_SECRET": cs, "REDIRECT_URI": ru})
             self.result = True
             self.destroy()
         except Exception as e:
@@ -161,6 +182,10 @@ class ModernCredentialsDialog(ModernDialog):
         self.result = False
         self.destroy()
 
+    def open_developer_portal(self):
+        import webbrowser  # Only needed on click, keeps it off the startup path
+        webbrowser.open("https://developer.spotify.com/dashboard")
+
     def open_env_in_editor(self):
         try:
             if os.path.exists(self.env_path):
@@ -171,11 +196,11 @@ class ModernCredentialsDialog(ModernDialog):
                 else:
                     subprocess.run(['xdg-open', self.env_path])
             else:
-                with open(self.env_path, "w") as f:
-                    f.write("# Spotify API Credentials\n")
-                    f.write("SPOTIPY_CLIENT_ID=\n")
-                    f.write("SPOTIPY_CLIENT_SECRET=\n")
-                    f.write("SPOTIPY_REDIRECT_URI=http://127.0.0.1:8888/callback\n")
+                write_file_atomic(self.env_path,
+                              "# Spotify API Credentials\n"
+                              "SPOTIPY_CLIENT_ID=\n"
+                              "SPOTIPY_CLIENT_SECRET=\n"
+                              "SPOTIPY_REDIRECT_URI=http://127.0.0.1:8888/callback\n")
                 self.open_env_in_editor()
         except Exception as e:
             messagebox.showerror("Fehler", f".env konnte nicht geöffnet werden: {e}", parent=self)
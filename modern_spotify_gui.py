@@ -13,16 +13,14 @@ with glassmorphism effects, smooth animations, and contemporary styling.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, scrolledtext, messagebox
+from tkinter import ttk, messagebox
 import os
 import sys
 import time
 import subprocess
-import webbrowser
 import re
-import traceback
 import threading
-from datetime import datetime
+from collections import deque
 
 # Remove all [DEBUG] output and suppress PIL warning for end users
 # Only print PIL warning if running in a dev/debug mode
@@ -40,6 +38,40 @@ try:
 except ImportError:
     get_monitors = None
 
+# Project paths, resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_VENV_DIR = os.path.join(_MODULE_DIR, "venv_spotify")
+_ENV_PATH = os.path.join(_MODULE_DIR, ".env")
+_MAIN_SCRIPT = os.path.join(_MODULE_DIR, "main.py")
+
+CONSOLE_FLUSH_MS = 100  # Console output is inserted in batches at most this often
+CONSOLE_MAX_LINES = 1000  # Beyond this the oldest lines are dropped...
+CONSOLE_TRIM_LINES = 200  # ...this many at a time, so trimming doesn't happen on every flush
+CONSOLE_TAGS = ('success', 'error', 'warning')  # Console text tags, colored like the theme's status colors
+
+# Compiled once, used for every line of generator output
+_ANSI_SUB = re.compile(r'\x1b\[[0-9;]*m').sub
+_SPOTIFY_URL = re.compile(r'https://open\.spotify\.com/playlist/\w+').search
+
+def _python_candidates():
+    """Interpreters for main.py in order of preference - the venv's first, then the running one"""
+    if sys.platform == "win32":
+        # pythonw.exe suppresses the command window
+        return [os.path.join(_VENV_DIR, "Scripts", "pythonw.exe"),
+                os.path.join(_VENV_DIR, "Scripts", "python.exe"),
+                os.path.join(os.path.dirname(sys.executable), "pythonw.exe"),
+                sys.executable]
+    return [os.path.join(_VENV_DIR, "bin", "python"), sys.executable]
+
+def _popen_first(executables, args, **kwargs):
+    """Start args with the first executable that exists - EAFP instead of probing each path first"""
+    for executable in executables[:-1]:
+        try:
+            return subprocess.Popen([executable, *args], **kwargs)
+        except FileNotFoundError:
+            pass
+    return subprocess.Popen([executables[-1], *args], **kwargs)
+
 # Modern UI Configuration
 class ModernConfig:
     # Color Schemes - Material Design 3 inspired
@@ -288,10 +320,14 @@ class ModernSpotifyGUI:
         self.animation_after_id = None
         self.status_animation_id = None
         
+        # Console output waiting for _flush_console - (text, tag) pairs, appended from any thread
+        self._console_pending = deque()
+        self._console_flush_job = None
+        
         # Paths
-        self.current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.venv_dir = os.path.join(self.current_dir, "venv_spotify")
-        self.env_path = os.path.join(self.current_dir, ".env")
+        self.current_dir = _MODULE_DIR
+        self.venv_dir = _VENV_DIR
+        self.env_path = _ENV_PATH
         
         # Create the beautiful UI
         self.create_modern_ui()
@@ -601,7 +637,8 @@ class ModernSpotifyGUI:
         console_frame = tk.Frame(output_card, bg=self.style_manager.colors['surface_container'])
         console_frame.pack(fill='both', expand=True, padx=ModernConfig.SPACING['md'], pady=(0, ModernConfig.SPACING['md']))
         
-        self.console = scrolledtext.ScrolledText(
+        # Plain Text plus Scrollbar - no ScrolledText wrapper frame around the console
+        self.console = tk.Text(
             console_frame,
             wrap=tk.WORD,
             font=ModernConfig.FONTS['monospace'],
@@ -613,8 +650,12 @@ class ModernSpotifyGUI:
             padx=ModernConfig.SPACING['sm'],
             pady=ModernConfig.SPACING['sm']
         )
-        self.console.pack(fill='both', expand=True)
+        console_scrollbar = tk.Scrollbar(console_frame, command=self.console.yview)
+        self.console.configure(yscrollcommand=console_scrollbar.set)
+        console_scrollbar.pack(side='right', fill='y')
+        self.console.pack(side='left', fill='both', expand=True)
         self.console.config(state=tk.DISABLED)
+        self._configure_console_tags()
         
         # Welcome message
         self.write_to_console("🎵 Welcome to Spotify Playlist Generator!\n")
@@ -658,6 +699,7 @@ class ModernSpotifyGUI:
     def toggle_theme(self):
         """Toggle between dark and light themes with smooth transition"""
         self.style_manager.toggle_theme()
+        self._configure_console_tags()
         try:
             theme_button = self.theme_btn.winfo_children()[0]
             new_text = '☀️' if self.style_manager.current_theme == 'dark' else '🌙'
@@ -684,31 +726,42 @@ class ModernSpotifyGUI:
         self.status_animation_id = self.root.after(1000, self.update_status_animation)
     
     def write_to_console(self, text, tag=None):
-        """Write text to console with optional styling"""
+        """Write text to console with optional styling (batched, see _flush_console)"""
+        self._console_pending.append((text, tag))
+        if self._console_flush_job is None:
+            self._console_flush_job = self.root.after(CONSOLE_FLUSH_MS, self._flush_console)
+    
+    def _configure_console_tags(self):
+        """Color the console tags once per theme instead of on every flush"""
+        for tag in CONSOLE_TAGS:
+            self.console.tag_configure(tag, foreground=self.style_manager.colors[tag])
+    
+    def _flush_console(self):
+        """Insert all pending console text with a single insert call"""
+        self._console_flush_job = None
+        args = []
+        while self._console_pending:
+            text, tag = self._console_pending.popleft()
+            args += (text, tag if tag in CONSOLE_TAGS else ())
+        if not args:
+            return
         try:
             self.console.config(state=tk.NORMAL)
-            
-            if tag == 'success':
-                self.console.insert(tk.END, text, 'success')
-                self.console.tag_configure('success', foreground=self.style_manager.colors['success'])
-            elif tag == 'error':
-                self.console.insert(tk.END, text, 'error')
-                self.console.tag_configure('error', foreground=self.style_manager.colors['error'])
-            elif tag == 'warning':
-                self.console.insert(tk.END, text, 'warning')
-                self.console.tag_configure('warning', foreground=self.style_manager.colors['warning'])
-            else:
-                self.console.insert(tk.END, text)
-            
+            # Text.insert takes any number of text, tags pairs
+            self.console.insert(tk.END, *args)
+            # Keep the Text widget bounded so inserts and redraws don't slow down over a long session
+            line_count = int(self.console.index("end-1c").split(".")[0])
+            if line_count > CONSOLE_MAX_LINES:
+                self.console.delete("1.0", f"{line_count - CONSOLE_MAX_LINES + CONSOLE_TRIM_LINES}.0")
             self.console.see(tk.END)
             self.console.config(state=tk.DISABLED)
-            self.root.update_idletasks()
         except:
             pass
     
     def clear_console(self):
         """Clear console output"""
         try:
+            self._console_pending.clear()
             self.console.config(state=tk.NORMAL)
             self.console.delete(1.0, tk.END)
             self.console.config(state=tk.DISABLED)
@@ -718,6 +771,7 @@ class ModernSpotifyGUI:
     
     def browse_file(self):
         """Open file dialog to select playlist file"""
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select Playlist File",
             filetypes=[
@@ -827,6 +881,7 @@ class ModernSpotifyGUI:
             self.write_to_console("\n🎉 Playlist created successfully!\n", 'success')
             if playlist_url:
                 if messagebox.askyesno("Success!", f"Playlist '{playlist_name}' created successfully!\n\nWould you like to open it in Spotify?"):
+                    import webbrowser
                     webbrowser.open(playlist_url)
         else:
             self.status_var.set("❌ Failed to create playlist")
@@ -852,7 +907,11 @@ class ModernSpotifyGUI:
             pass
         self.write_to_console(f"\n❌ Error: {error_msg}\n", 'error')
 
-    def _run_command_and_process_output(self, command, playlist_name, songs_file):
+    def _run_command_and_process_output(self, command, playlist_name, songs_file, fallbacks=()):
+        """
+        Run command and stream its output, fallbacks are executables tried when command[0] does not exist.
+        Runs on the worker thread: dialogs go through root.after, the playlist URL is left in _playlist_url.
+        """
         self.write_to_console(f"Starting playlist creation: {playlist_name}\n")
         self.write_to_console(f"Using songs from: {songs_file}\n\n")
         if isinstance(command, list) and command[0] == "/bin/bash":
@@ -860,30 +919,46 @@ class ModernSpotifyGUI:
         else:
             self.write_to_console(f"Command: {' '.join(str(c) for c in command) if isinstance(command, list) else command}\n\n")
         try:
-            import select
-            process = subprocess.Popen(
-                command,
+            process = _popen_first(
+                [command[0], *fallbacks],
+                command[1:],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
             playlist_url = None
             if process and process.stdout:
-                for line in iter(process.stdout.readline, ""):
-                    if not line:
-                        break
-                    clean_line = line.strip()
-                    clean_line = re.sub(r'\x1b\[\d+(;\d+)*m', '', clean_line)
-                    self.write_to_console(f"{clean_line}\n")
-                    self.console.update_idletasks()  # Sofort flushen
+                # Blocking 64 KiB reads on this worker thread, lines are split and decoded per chunk
+                fd = process.stdout.fileno()
+                pending = b""
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if chunk:
+                        pending += chunk
+                        cut = pending.rfind(b"\n")
+                        if cut == -1:
+                            continue
+                        lines = pending[:cut].decode("utf-8", "replace").splitlines()
+                        pending = pending[cut + 1:]
+                    else:
+                        # End of output, flush a last line without newline
+                        lines = [pending.decode("utf-8", "replace")] if pending else []
+                    clean_lines = [_ANSI_SUB('', line.strip()) for line in lines]
+                    if clean_lines:
+                        self.write_to_console("\n".join(clean_lines) + "\n")
                     # Playlist-URL extrahieren
-                    url_match = re.search(r'https://open\.spotify\.com/playlist/\w+', clean_line)
-                    if url_match:
-                        playlist_url = url_match.group(0)
+                    for clean_line in clean_lines:
+                        url_match = _SPOTIFY_URL(clean_line)
+                        if url_match:
+                            playlist_url = url_match.group(0)
+                    if not chunk:
+                        break
+                process.stdout.close()
             if process:
-                return_code = process.wait()
+                # At EOF the process has usually exited already
+                return_code = process.poll()
+                if return_code is None:
+                    return_code = process.wait()
             else:
                 self.write_to_console("Error: Process failed to start\n")
                 return False
@@ -891,12 +966,12 @@ class ModernSpotifyGUI:
                 self.write_to_console("\n✅ Playlist created successfully!\n")
                 if playlist_url:
                     self.write_to_console(f"Playlist URL: {playlist_url}\n")
-                    if messagebox.askyesno("Success", f"Playlist '{playlist_name}' created successfully! Open in browser?"):
-                        webbrowser.open(playlist_url)
+                    # _finish_playlist_creation offers to open it
+                    self._playlist_url = playlist_url
                 return True
             else:
                 self.write_to_console(f"\n❌ Error: Process exited with code {return_code}\n")
-                messagebox.showerror("Error", f"Failed to create playlist. Exit code: {return_code}")
+                self.root.after(0, messagebox.showerror, "Error", f"Failed to create playlist. Exit code: {return_code}")
                 return False
         except Exception as e:
             self.write_to_console(f"\n❌ Error: {str(e)}\n")
@@ -905,41 +980,29 @@ class ModernSpotifyGUI:
                     self.write_to_console("\nTrying alternative method with Python...\n")
                     if hasattr(self, '_create_playlist_using_python'):
                         return self._create_playlist_using_python(playlist_name, songs_file)
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.root.after(0, messagebox.showerror, "Error", f"An error occurred: {str(e)}")
             return False
 
     def _create_playlist_thread(self, playlist_name, songs_file):
         try:
-            # Robust venv Python selection for all platforms
-            venv_python = os.path.join(self.current_dir, "venv_spotify", "bin", "python")
-            if sys.platform == "win32":
-                venv_python = os.path.join(self.current_dir, "venv_spotify", "Scripts", "python.exe")
-                # Use pythonw.exe to suppress command window
-                pythonw = os.path.join(self.current_dir, "venv_spotify", "Scripts", "pythonw.exe")
-                if os.path.exists(pythonw):
-                    venv_python = pythonw
-            if not os.path.exists(venv_python):
-                # Only fallback if both venv paths are missing
-                venv_python = sys.executable
-                # Use pythonw.exe if available and on Windows
-                if sys.platform == "win32":
-                    pythonw = os.path.join(os.path.dirname(sys.executable), "pythonw.exe")
-                    if os.path.exists(pythonw):
-                        venv_python = pythonw
-            script_path = os.path.join(self.current_dir, "main.py")
-            command = [venv_python, script_path, playlist_name, songs_file]
-            success = self._run_command_and_process_output(command, playlist_name, songs_file)
+            # Robust venv Python selection for all platforms - missing interpreters surface
+            # as FileNotFoundError from Popen, no exists() probing beforehand
+            python, *fallbacks = _python_candidates()
+            command = [python, _MAIN_SCRIPT, playlist_name, songs_file]
+            self._playlist_url = None
+            success = self._run_command_and_process_output(command, playlist_name, songs_file, fallbacks)
             if not success:
                 self.write_to_console("\n❌ Playlist generation failed. See above for details.\n", 'error')
-            self.root.after(0, lambda: self._finish_playlist_creation(success, None, playlist_name))
+            playlist_url = self._playlist_url
+            self.root.after(0, lambda: self._finish_playlist_creation(success, playlist_url, playlist_name))
         except Exception as e:
             import traceback
             self.write_to_console(f"\n❌ Exception: {e}\n{traceback.format_exc()}\n", 'error')
             self.root.after(0, lambda: self._finish_playlist_creation(False, None, playlist_name))
 
-def create_modern_splash():
-    """Create a beautiful modern splash screen"""
-    splash = tk.Tk()
+def create_modern_splash(root):
+    """Create a beautiful modern splash screen on top of the (hidden) root window"""
+    splash = tk.Toplevel(root)
     splash.title("")
     splash.overrideredirect(True)
     
@@ -1035,19 +1098,40 @@ def create_modern_splash():
     splash.update()
     return splash, splash_state
 
+SPLASH_MAX_SECONDS = 2.5  # Close the splash after this even if warming up isn't done
+
+def _prewarm_imports():
+    """Import modules that are only needed later, while the splash is showing"""
+    import webbrowser  # noqa: F401
+    import modern_dialogs  # noqa: F401
+
 def main():
     """Main application entry point"""
+    # One Tk interpreter for splash and app - the root stays hidden while the splash shows
+    root = tk.Tk()
+    root.withdraw()
+    
     # Create and show splash screen
     try:
-        splash, splash_state = create_modern_splash()
-        # Show splash for 2.5 seconds
-        splash.after(2500, lambda: (splash_state["cleanup"](), splash.destroy()))
-        splash.mainloop()
+        splash, splash_state = create_modern_splash(root)
+        # Do real work behind the splash instead of a fixed delay
+        prewarm = threading.Thread(target=_prewarm_imports, daemon=True)
+        prewarm.start()
+        started = time.monotonic()
+        def close_when_ready():
+            if prewarm.is_alive() and time.monotonic() - started < SPLASH_MAX_SECONDS:
+                splash.after(50, close_when_ready)
+                return
+            splash_state["cleanup"]()
+            splash.destroy()
+            root.quit()
+        splash.after(50, close_when_ready)
+        root.mainloop()
     except Exception:
         pass  # Skip splash if there are issues
     
     # Create main application
-    root = tk.Tk()
+    root.deiconify()
     app = ModernSpotifyGUI(root)
     
     # Handle window closing
@@ -1056,6 +1140,8 @@ def main():
             root.after_cancel(app.status_animation_id)
         if app.animation_after_id:
             root.after_cancel(app.animation_after_id)
+        if app._console_flush_job:
+            root.after_cancel(app._console_flush_job)
         root.destroy()
         sys.exit(0)
     